@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from api_yamdb.versions import cache_in_memory
+
+PROCESS_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES['default']['BACKEND']
+    if backend in PROCESS_CACHE_BACKENDS:
+        return [Warning(
+            'The default cache is local to each process.',
+            hint=(
+                'Version stamps behind ETag and Last-Modified, token '
+                'versions and throttle counters need a cache shared by all '
+                'workers. Use memcached when running several processes.'
+            ),
+            id='api.W001',
+        )]
+    if not cache_in_memory():
+        return [Warning(
+            'The default cache is kept in the database or on disk.',
+            hint=(
+                'Version stamps, token versions and throttle counters are '
+                'read on every request, so each read becomes a query or a '
+                'file access. Permissions are then checked against the '
+                'user row instead of token claims. Use memcached.'
+            ),
+            id='api.W002',
+        )]
+    return []
@@ -0,0 +1,83 @@
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.records import CommentRecord, ReviewRecord, TitleRecord
+from api.serializers import (
+    CommentRecordSerializer,
+    ReviewRecordSerializer,
+    TitleRecordSerializer,
+)
+from api_yamdb.parsers import FastJSONParser, MessagePackParser
+from api_yamdb.renderers import FastJSONRenderer, MessagePackRenderer, msgpack
+from reviews.models import Comment, Review, Title
+
+
+class Command(BaseCommand):
+    help = 'Compares JSON and MessagePack payload size and speed'
+
+    formats = (
+        ('stdlib json', JSONRenderer, JSONParser),
+        ('json', FastJSONRenderer, FastJSONParser),
+        ('msgpack', MessagePackRenderer, MessagePackParser),
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, default=100, help='Rows per page'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20, help='Number of runs'
+        )
+
+    def handle(self, *args, **options):
+        if msgpack is None:
+            raise CommandError('msgpack is not installed')
+        pages = (
+            ('titles', Title, TitleRecord, TitleRecordSerializer),
+            ('reviews', Review, ReviewRecord, ReviewRecordSerializer),
+            ('comments', Comment, CommentRecord, CommentRecordSerializer),
+        )
+        for name, model, record, serializer in pages:
+            queryset = record.fetch(
+                model.objects.all(), serializer.record_fields
+            )
+            results = serializer(
+                queryset[:options['rows']], many=True
+            ).data
+            data = {
+                'count': len(results),
+                'next': None,
+                'previous': None,
+                'results': results,
+            }
+            decoded = []
+            for format_name, renderer_class, parser_class in self.formats:
+                encode, payload = self.measure(
+                    lambda: renderer_class().render(data), options['repeat']
+                )
+                decode, value = self.measure(
+                    lambda: parser_class().parse(BytesIO(payload)),
+                    options['repeat'],
+                )
+                decoded.append(value)
+                self.stdout.write(
+                    f'{name} {format_name}: {len(payload)} bytes, '
+                    f'encode {encode * 1000:.3f} ms, '
+                    f'decode {decode * 1000:.3f} ms'
+                )
+            if any(value != decoded[0] for value in decoded):
+                raise CommandError(f'{name}: payloads differ')
+
+    @staticmethod
+    def measure(function, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = function()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
@@ -0,0 +1,84 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from api.records import CommentRecord, ReviewRecord, TitleRecord
+from api.serializers import (
+    CommentRecordSerializer,
+    CommentSerializer,
+    ReviewRecordSerializer,
+    ReviewSerializer,
+    TitleRecordSerializer,
+    TitleSerializer,
+)
+from reviews.models import Comment, Review, Title
+
+
+class Command(BaseCommand):
+    help = 'Compares model serializers with the values() record read path'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, default=100, help='Rows rendered per run'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20, help='Number of runs'
+        )
+
+    def handle(self, *args, **options):
+        cases = (
+            (
+                'titles',
+                Title.objects.select_related('category').prefetch_related(
+                    'genre'
+                ),
+                TitleSerializer,
+                TitleRecord,
+                TitleRecordSerializer,
+            ),
+            (
+                'reviews',
+                Review.objects.select_related('author'),
+                ReviewSerializer,
+                ReviewRecord,
+                ReviewRecordSerializer,
+            ),
+            (
+                'comments',
+                Comment.objects.select_related('author'),
+                CommentSerializer,
+                CommentRecord,
+                CommentRecordSerializer,
+            ),
+        )
+        for name, queryset, serializer, record, record_serializer in cases:
+            queryset = queryset.order_by('pk')[:options['rows']]
+            model_time, model_output = self.measure(
+                queryset, serializer, options['repeat']
+            )
+            record_time, record_output = self.measure(
+                record.fetch(queryset, record_serializer.record_fields),
+                record_serializer,
+                options['repeat'],
+            )
+            if model_output != record_output:
+                raise CommandError(f'{name}: record output differs')
+            self.stdout.write(
+                f'{name}: model {model_time * 1000:.2f} ms, '
+                f'records {record_time * 1000:.2f} ms, '
+                f'{model_time / max(record_time, 1e-9):.1f}x faster'
+            )
+
+    @staticmethod
+    def measure(queryset, serializer, repeat):
+        renderer = JSONRenderer()
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            output = renderer.render(
+                serializer(queryset.all(), many=True).data
+            )
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, output
@@ -0,0 +1,127 @@
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Barrier
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from reviews.models import Review, Title
+
+UserModel = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Posts reviews from concurrent writers and checks the results'
+
+    prefix = 'benchmark_writer'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--writers', type=int, default=8, help='Concurrent writers'
+        )
+        parser.add_argument(
+            '--titles', type=int, default=20, help='Titles reviewed'
+        )
+        parser.add_argument(
+            '--duplicates',
+            type=int,
+            default=3,
+            help='Concurrent posts of the same review by each writer',
+        )
+
+    def handle(self, *args, **options):
+        writers, duplicates = options['writers'], options['duplicates']
+        if (
+            UserModel.objects.filter(username__startswith=self.prefix).exists()
+            or Title.objects.filter(name__startswith=self.prefix).exists()
+        ):
+            raise CommandError(
+                f'Objects named {self.prefix}* already exist, '
+                'refusing to touch them'
+            )
+        UserModel.objects.bulk_create(
+            UserModel(username=f'{self.prefix}_{index}')
+            for index in range(writers)
+        )
+        users = list(
+            UserModel.objects.filter(username__startswith=self.prefix)
+        )
+        Title.objects.bulk_create(
+            Title(name=f'{self.prefix}_{index}', year=2000)
+            for index in range(options['titles'])
+        )
+        titles = list(Title.objects.filter(name__startswith=self.prefix))
+        user_ids = [user.pk for user in users]
+        title_ids = [title.pk for title in titles]
+        barrier = Barrier(writers * duplicates)
+
+        def write(user):
+            client = APIClient(raise_request_exception=False)
+            client.force_authenticate(user)
+            statuses = Counter()
+            try:
+                barrier.wait()
+                for title in titles:
+                    statuses[client.post(
+                        f'/api/v1/titles/{title.pk}/reviews/',
+                        data={'text': self.prefix, 'score': 5},
+                    ).status_code] += 1
+            finally:
+                connections.close_all()
+            return statuses
+
+        rest_framework = {
+            **settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}
+        }
+        logger = logging.getLogger('django.request')
+        level = logger.level
+        logger.setLevel(logging.ERROR)
+        try:
+            with override_settings(REST_FRAMEWORK=rest_framework):
+                started = time.perf_counter()
+                with ThreadPoolExecutor(writers * duplicates) as executor:
+                    statuses = sum(
+                        executor.map(write, users * duplicates), Counter()
+                    )
+                elapsed = time.perf_counter() - started
+            self.verify(users, titles, statuses, duplicates)
+        finally:
+            logger.setLevel(level)
+            Title.objects.filter(pk__in=title_ids).delete()
+            UserModel.objects.filter(pk__in=user_ids).delete()
+
+        requests = sum(statuses.values())
+        self.stdout.write(
+            f'{requests} requests from {writers} writers in {elapsed:.2f}s '
+            f'({requests / max(elapsed, 1e-9):.0f} requests/s), '
+            f'{statuses[HTTPStatus.CREATED]} created, '
+            f'{statuses[HTTPStatus.BAD_REQUEST]} rejected as duplicates'
+        )
+
+    def verify(self, users, titles, statuses, duplicates):
+        expected = len(users) * len(titles)
+        if set(statuses) - {HTTPStatus.CREATED, HTTPStatus.BAD_REQUEST}:
+            raise CommandError(
+                f'Unexpected responses by status: {dict(statuses)}'
+            )
+        if statuses[HTTPStatus.CREATED] != expected:
+            raise CommandError(
+                f'{statuses[HTTPStatus.CREATED]} reviews created, '
+                f'expected {expected}'
+            )
+        if statuses[HTTPStatus.BAD_REQUEST] != expected * (duplicates - 1):
+            raise CommandError(f'Unexpected duplicate count: {statuses}')
+        if Review.objects.filter(title__in=titles).count() != expected:
+            raise CommandError('Stored review count differs')
+        for title in Title.objects.filter(
+            pk__in=[title.pk for title in titles]
+        ):
+            if title.score_count != len(users):
+                raise CommandError(f'Title {title.pk} score count differs')
@@ -1,3 +1,16 @@
+from hashlib import md5
+
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from api_yamdb.constants import CACHE_MAX_AGE
+from api_yamdb.versions import get_last_modified, get_versions
 from users.permissions import AnonymousPermission
 
 
@@ -7,3 +20,144 @@ class PermissionsMixin:
         if self.action in {'list', 'retrieve'}:
             return (AnonymousPermission(),)
         return super().get_permissions()
+
+
+class CreateThrottleMixin:
+
+    def get_throttles(self):
+        if self.action != 'create':
+            return ()
+        return super().get_throttles()
+
+
+class TaxonomySnapshotMixin:
+    taxonomy = None
+
+    def get_queryset(self):
+        if (
+            self.action == 'list'
+            and not self.request.query_params.get(api_settings.SEARCH_PARAM)
+        ):
+            return self.taxonomy.get().items
+        return super().get_queryset()
+
+
+def split_fields(value):
+    return {field.strip() for field in value.split(',') if field.strip()}
+
+
+class SparseFieldsMixin:
+    fields_param = 'fields'
+    exclude_param = 'exclude'
+
+    def is_read(self):
+        return (
+            self.request.method in {'GET', 'HEAD'}
+            and self.action in {'list', 'retrieve'}
+        )
+
+    def get_available_fields(self):
+        serializer_class = self.get_serializer_class()
+        return getattr(serializer_class, 'record_fields', None) or tuple(
+            serializer_class.Meta.fields
+        )
+
+    def get_sparse_fields(self):
+        params = self.request.query_params
+        if not self.is_read() or not (
+            params.get(self.fields_param) or params.get(self.exclude_param)
+        ):
+            return None
+        available = self.get_available_fields()
+        for param in (self.fields_param, self.exclude_param):
+            unknown = split_fields(params.get(param, '')) - set(available)
+            if unknown:
+                raise ValidationError({param: (
+                    f'Неизвестные поля: {", ".join(sorted(unknown))}.'
+                )})
+        requested = split_fields(params.get(self.fields_param, ''))
+        excluded = split_fields(params.get(self.exclude_param, ''))
+        return tuple(
+            field for field in available
+            if (not requested or field in requested)
+            and field not in excluded
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return serializer
+        target = getattr(serializer, 'child', serializer)
+        if hasattr(target, 'accessors'):
+            target.accessors = tuple(
+                (name, accessor) for name, accessor in target.accessors
+                if name in fields
+            )
+        else:
+            for name in set(target.fields) - set(fields):
+                target.fields.pop(name)
+        return serializer
+
+
+class RecordMixin(SparseFieldsMixin):
+    record_class = None
+    record_serializer_class = None
+
+    def use_records(self):
+        return self.is_read()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.use_records():
+            return queryset
+        keyset = getattr(self, 'keyset_ordering', None) or ()
+        return self.record_class.fetch(
+            queryset,
+            self.get_sparse_fields() or self.get_available_fields(),
+            required=tuple(field.lstrip('-') for field in keyset),
+        )
+
+    def get_serializer_class(self):
+        if self.use_records():
+            return self.record_serializer_class
+        return super().get_serializer_class()
+
+
+class ConditionalListMixin:
+
+    def get_version_keys(self):
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_get(super().list, request, *args, **kwargs)
+
+    def conditional_get(self, handler, request, *args, **kwargs):
+        keys = self.get_version_keys()
+        etag = quote_etag(md5('|'.join((
+            request.get_full_path(),
+            request.accepted_media_type,
+            *map(str, get_versions(*keys)),
+        )).encode()).hexdigest())
+        last_modified = get_last_modified(*keys)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        if request.user.is_authenticated:
+            patch_cache_control(response, private=True, no_cache=True)
+        else:
+            patch_cache_control(response, public=True, max_age=CACHE_MAX_AGE)
+        patch_vary_headers(response, ('Accept', 'Authorization'))
+        return response
+
+
+class ConditionalGetMixin(ConditionalListMixin):
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_get(
+            super().retrieve, request, *args, **kwargs
+        )
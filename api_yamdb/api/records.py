@@ -0,0 +1,122 @@
+from functools import lru_cache
+
+from django.db.models.query import ValuesListIterable
+
+from reviews.models import GenreTitle
+
+
+class RecordIterable(ValuesListIterable):
+    record_class = None
+    related = ()
+
+    def __iter__(self):
+        record_class = self.record_class
+        names = [
+            record_class.attributes[column]
+            for column in self.queryset._fields
+        ]
+        records = [record_class(names, row) for row in super().__iter__()]
+        for field in self.related:
+            getattr(record_class, f'load_{field}')(records)
+        return iter(records)
+
+
+class Record:
+    __slots__ = ()
+    columns = {}
+    dependencies = {}
+    related = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.attributes = {
+            cls.columns.get(name, name): name for name in cls.__slots__
+            if name not in cls.related
+        }
+
+    def __init__(self, names, values):
+        for name, value in zip(names, values):
+            setattr(self, name, value)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_iterable(cls, related):
+        return type(
+            f'{cls.__name__}Iterable',
+            (RecordIterable,),
+            {'record_class': cls, 'related': related},
+        )
+
+    @classmethod
+    def fetch(cls, queryset, fields, required=()):
+        related = tuple(field for field in cls.related if field in fields)
+        names = {'id', *required}
+        for field in fields:
+            if field not in cls.related:
+                names.update(cls.dependencies.get(field, (field,)))
+        queryset = queryset.prefetch_related(None).values_list(*(
+            cls.columns.get(name, name)
+            for name in cls.__slots__ if name in names
+        ))
+        queryset._iterable_class = cls.get_iterable(related)
+        return queryset
+
+
+class TitleRecord(Record):
+    __slots__ = (
+        'id',
+        'name',
+        'year',
+        'description',
+        'score_sum',
+        'score_count',
+        'category_name',
+        'category_slug',
+        'genre',
+    )
+    columns = {
+        'category_name': 'category__name',
+        'category_slug': 'category__slug',
+    }
+    dependencies = {
+        'rating': ('score_sum', 'score_count'),
+        'category': ('category_name', 'category_slug'),
+    }
+    related = ('genre',)
+
+    @property
+    def rating(self):
+        if not self.score_count:
+            return None
+        return self.score_sum // self.score_count
+
+    @property
+    def category(self):
+        if self.category_slug is None:
+            return None
+        return {'name': self.category_name, 'slug': self.category_slug}
+
+    @staticmethod
+    def load_genre(records):
+        genres = {}
+        if records:
+            for title_id, name, slug in GenreTitle.objects.filter(
+                title_id__in=[record.id for record in records]
+            ).order_by('genre__name').values_list(
+                'title_id', 'genre__name', 'genre__slug'
+            ):
+                genres.setdefault(title_id, []).append(
+                    {'name': name, 'slug': slug}
+                )
+        for record in records:
+            record.genre = genres.get(record.id, [])
+
+
+class ReviewRecord(Record):
+    __slots__ = ('id', 'text', 'author', 'score', 'pub_date')
+    columns = {'author': 'author__username'}
+
+
+class CommentRecord(Record):
+    __slots__ = ('id', 'text', 'author', 'pub_date')
+    columns = {'author': 'author__username'}
@@ -1,7 +1,64 @@
+from operator import attrgetter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Max
 from rest_framework import serializers
 
-from api_yamdb.constants import NAME_FIELD_LENGTH
+from api_yamdb.constants import (
+    BULK_CREATE_BATCH_SIZE,
+    NAME_FIELD_LENGTH,
+    SCORE_MAX_VALUE,
+    SCORE_MIN_VALUE,
+)
+from api_yamdb.versions import bump_versions_on_commit, get_label
 from reviews.models import Category, Genre, Title, GenreTitle, Review, Comment
+from reviews.taxonomy import categories, genres
+
+
+def compile_accessor(name, convert=None):
+    getter = attrgetter(name)
+    if convert is None:
+        return getter
+    return lambda record: convert(getter(record))
+
+
+class RecordSerializer(serializers.BaseSerializer):
+    record_fields = ()
+    converters = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.accessors = tuple(
+            (name, compile_accessor(name, cls.converters.get(name)))
+            for name in cls.record_fields
+        )
+
+    def to_representation(self, instance):
+        return {name: accessor(instance) for name, accessor in self.accessors}
+
+
+class TaxonomySlugField(serializers.SlugRelatedField):
+
+    def __init__(self, taxonomy, **kwargs):
+        self.taxonomy = taxonomy
+        kwargs.setdefault('queryset', taxonomy.model.objects.all())
+        super().__init__(slug_field='slug', **kwargs)
+
+    def get_snapshot(self):
+        snapshots = self.context.setdefault('taxonomy_snapshots', {})
+        if self.taxonomy.label not in snapshots:
+            snapshots[self.taxonomy.label] = self.taxonomy.get()
+        return snapshots[self.taxonomy.label]
+
+    def to_internal_value(self, data):
+        try:
+            return self.get_snapshot().by_slug[data]
+        except KeyError:
+            self.fail(
+                'does_not_exist', slug_name=self.slug_field, value=str(data)
+            )
+        except TypeError:
+            self.fail('invalid')
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -21,31 +78,78 @@ class GenreSerializer(serializers.ModelSerializer):
 class TitleSerializer(serializers.ModelSerializer):
     genre = GenreSerializer(many=True)
     category = CategorySerializer()
-    rating = serializers.IntegerField()
+    rating = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Title
-        fields = '__all__'
+        fields = (
+            'id',
+            'name',
+            'year',
+            'rating',
+            'description',
+            'genre',
+            'category',
+        )
+
+
+class TitleRecordSerializer(RecordSerializer):
+    record_fields = TitleSerializer.Meta.fields
+
+
+class TitleScoresSerializer(serializers.ModelSerializer):
+    rating = serializers.IntegerField(read_only=True)
+    scores = serializers.DictField(
+        source='score_distribution',
+        child=serializers.IntegerField(),
+        read_only=True,
+    )
+
+    class Meta:
+        model = Title
+        fields = ('id', 'rating', 'score_count', 'scores')
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        if representation['rating'] == 0:
-            representation['rating'] = None
-        return representation
+
+class TitleListSerializer(serializers.ListSerializer):
+
+    def create(self, validated_data):
+        genres = [item.pop('genre') for item in validated_data]
+        titles = [Title(**item) for item in validated_data]
+        try:
+            with transaction.atomic():
+                Title.objects.bulk_create(
+                    titles, batch_size=BULK_CREATE_BATCH_SIZE
+                )
+                if titles and titles[-1].pk is None:
+                    # The insert holds the write lock: the newest ids are ours.
+                    last_id = Title.objects.aggregate(
+                        last_id=Max('id')
+                    )['last_id']
+                    for title_id, title in enumerate(
+                        titles, last_id - len(titles) + 1
+                    ):
+                        title.id = title_id
+                GenreTitle.objects.bulk_create(
+                    (
+                        GenreTitle(genre=genre, title=title)
+                        for title, title_genres in zip(titles, genres)
+                        for genre in title_genres
+                    ),
+                    batch_size=BULK_CREATE_BATCH_SIZE,
+                )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                'Не удалось сохранить произведения, повторите запрос.'
+            )
+        bump_versions_on_commit(get_label(Title))
+        return titles
 
 
 class TitlePostSerializer(serializers.ModelSerializer):
     name = serializers.CharField(max_length=NAME_FIELD_LENGTH, required=True)
     description = serializers.CharField(required=False, allow_blank=True)
-    genre = serializers.SlugRelatedField(
-        slug_field='slug',
-        read_only=False,
-        many=True,
-        queryset=Genre.objects.all(),
-    )
-    category = serializers.SlugRelatedField(
-        slug_field='slug', read_only=False, queryset=Category.objects.all()
-    )
+    genre = TaxonomySlugField(genres, many=True)
+    category = TaxonomySlugField(categories)
 
     class Meta:
         model = Title
@@ -58,7 +162,9 @@ class TitlePostSerializer(serializers.ModelSerializer):
             'category',
         )
         read_only_fields = ('id',)
+        list_serializer_class = TitleListSerializer
 
+    @transaction.atomic
     def create(self, validated_data):
         genres = validated_data.pop('genre')
         title = Title.objects.create(**validated_data)
@@ -76,7 +182,9 @@ class TitleDeleteSerializer(serializers.ModelSerializer):
 
 class ReviewSerializer(serializers.ModelSerializer):
     author = serializers.StringRelatedField(read_only=True)
-    score = serializers.IntegerField(max_value=10, min_value=1)
+    score = serializers.IntegerField(
+        max_value=SCORE_MAX_VALUE, min_value=SCORE_MIN_VALUE
+    )
 
     class Meta:
         model = Review
@@ -89,3 +197,15 @@ class CommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ('id', 'text', 'author', 'pub_date')
+
+
+class ReviewRecordSerializer(RecordSerializer):
+    record_fields = ReviewSerializer.Meta.fields
+    converters = {
+        'pub_date': serializers.DateTimeField().to_representation,
+    }
+
+
+class CommentRecordSerializer(RecordSerializer):
+    record_fields = CommentSerializer.Meta.fields
+    converters = ReviewRecordSerializer.converters
@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+
+from api_yamdb.versions import bump_versions_on_commit, get_key, get_label
+from reviews.models import Category, Comment, Genre, Review, Title
+
+UserModel = get_user_model()
+
+VERSION_DEPENDENCIES = {
+    Title: (Title,),
+    Genre: (Genre, Title),
+    Category: (Category, Title),
+    Review: (Review,),
+    Comment: (Comment,),
+    UserModel: (UserModel,),
+}
+
+
+def get_instance_keys(instance, created):
+    keys = [get_key(type(instance), instance.pk)]
+    if isinstance(instance, Review):
+        keys += [
+            get_key(Title, instance.title_id),
+            get_key(Review, 'title', instance.title_id),
+        ]
+    elif isinstance(instance, Comment):
+        keys.append(get_key(Comment, 'review', instance.review_id))
+    elif isinstance(instance, UserModel) and not created:
+        keys.append(get_key(UserModel, 'updated'))
+    return keys
+
+
+def bump_model_versions(sender, instance, created=False, **kwargs):
+    bump_versions_on_commit(
+        *(get_label(model) for model in VERSION_DEPENDENCIES[sender]),
+        *get_instance_keys(instance, created),
+    )
+
+
+for model in VERSION_DEPENDENCIES:
+    post_save.connect(bump_model_versions, sender=model)
+    post_delete.connect(bump_model_versions, sender=model)
@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import include, path, re_path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
@@ -6,7 +6,8 @@ from .views import (
     GenreViewSet,
     TitleViewSet,
     ReviewViewSet,
-    CommentViewSet
+    CommentViewSet,
+    ExportView,
 )
 
 router = DefaultRouter()
@@ -23,4 +24,12 @@ router.register(
     CommentViewSet,
     basename='comments'
 )
-urlpatterns = [path('v1/', include(router.urls))]
+urlpatterns = [
+    re_path(
+        r'^v1/export/(?P<dataset>titles|reviews|comments)'
+        r'\.(?P<output_format>ndjson|csv)$',
+        ExportView.as_view(),
+        name='export',
+    ),
+    path('v1/', include(router.urls)),
+]
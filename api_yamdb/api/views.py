@@ -1,52 +1,132 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from django_filters.rest_framework import (
     CharFilter,
     DjangoFilterBackend,
     FilterSet,
 )
-from django.db.models import Avg
 from rest_framework import filters, mixins, status, serializers, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
-from .mixins import PermissionsMixin
+from rest_framework.views import APIView
+from .mixins import (
+    ConditionalGetMixin,
+    ConditionalListMixin,
+    CreateThrottleMixin,
+    PermissionsMixin,
+    RecordMixin,
+    SparseFieldsMixin,
+    TaxonomySnapshotMixin,
+)
+from .records import CommentRecord, ReviewRecord, TitleRecord
 from .serializers import (
     CategorySerializer,
     TitleSerializer,
     TitlePostSerializer,
     TitleDeleteSerializer,
+    TitleScoresSerializer,
     GenreSerializer,
     ReviewSerializer,
     CommentSerializer,
+    CommentRecordSerializer,
+    ReviewRecordSerializer,
+    TitleRecordSerializer,
 )
+from api_yamdb.streaming import StreamingListMixin
+from api_yamdb.versions import get_key, get_label
+from reviews.export import FORMATS, export
 from reviews.models import Category, Genre, Title, Review, Comment
+from reviews.taxonomy import categories, genres
 from users.permissions import (
     AdministratorPermission,
+    AnonymousPermission,
     CustomReviewCommentPermission
 )
 
+UserModel = get_user_model()
+
 
 class TitleFilter(FilterSet):
-    genre = CharFilter(field_name='genre__slug')
-    category = CharFilter(field_name='category__slug')
+    genre = CharFilter(method='filter_taxonomy')
+    category = CharFilter(method='filter_taxonomy')
+    search = CharFilter(method='filter_search')
 
     class Meta:
-        fields = ('name', 'year', 'category', 'genre')
+        fields = ('name', 'year', 'category', 'genre', 'search')
         model = Title
 
+    def filter_taxonomy(self, queryset, name, value):
+        taxonomy = {'genre': genres, 'category': categories}[name]
+        item = taxonomy.get().by_slug.get(value)
+        if item is None:
+            return queryset.none()
+        return queryset.filter(**{name: item})
+
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value)
+
+
+class TaxonomySearchFilter(filters.SearchFilter):
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not query.strip():
+            return queryset
+        return queryset.search(query)
 
-class TitleViewSet(PermissionsMixin, viewsets.ModelViewSet):
-    queryset = Title.objects.all().annotate(rating=Avg('reviews__score'))
+
+class TitleViewSet(
+    PermissionsMixin,
+    ConditionalGetMixin,
+    StreamingListMixin,
+    RecordMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = Title.objects.select_related('category').prefetch_related(
+        'genre'
+    )
     serializer_class = TitleSerializer
+    record_class = TitleRecord
+    record_serializer_class = TitleRecordSerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = TitleFilter
     permission_classes = (AdministratorPermission,)
+    keyset_ordering = ('name', 'id')
+
+    def get_version_keys(self):
+        taxonomy = (get_label(Genre), get_label(Category))
+        if self.action == 'list':
+            return (get_label(Title), get_label(Review), *taxonomy)
+        return (get_key(Title, self.kwargs['pk']), *taxonomy)
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
-            return TitleSerializer
+            return super().get_serializer_class()
         if self.request.method == 'DELETE':
             return TitleDeleteSerializer
         return TitlePostSerializer
 
+    @action(detail=False, methods=('post',))
+    def bulk(self, request):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        title_ids = [title.pk for title in serializer.save()]
+        titles = Title.objects.select_related('category').prefetch_related(
+            'genre'
+        ).in_bulk(title_ids)
+        serializer = self.get_serializer(
+            [titles[title_id] for title_id in title_ids], many=True
+        )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, permission_classes=(AnonymousPermission,))
+    def scores(self, request, pk=None):
+        title = get_object_or_404(Title, pk=pk)
+        return Response(TitleScoresSerializer(title).data)
+
     def update(self, request, *args, **kwargs):
         if request.method == 'PUT':
             return Response(status=status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -55,6 +135,9 @@ class TitleViewSet(PermissionsMixin, viewsets.ModelViewSet):
 
 class CategoryViewSet(
     PermissionsMixin,
+    ConditionalListMixin,
+    TaxonomySnapshotMixin,
+    SparseFieldsMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.DestroyModelMixin,
@@ -62,14 +145,20 @@ class CategoryViewSet(
 ):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
-    filter_backends = (filters.SearchFilter,)
-    search_fields = ('name',)
+    taxonomy = categories
+    filter_backends = (TaxonomySearchFilter,)
     permission_classes = (AdministratorPermission,)
     lookup_field = 'slug'
 
+    def get_version_keys(self):
+        return (get_label(Category),)
+
 
 class GenreViewSet(
     PermissionsMixin,
+    ConditionalListMixin,
+    TaxonomySnapshotMixin,
+    SparseFieldsMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.DestroyModelMixin,
@@ -77,31 +166,56 @@ class GenreViewSet(
 ):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
-    filter_backends = (filters.SearchFilter,)
-    search_fields = ('name',)
+    taxonomy = genres
+    filter_backends = (TaxonomySearchFilter,)
     permission_classes = (AdministratorPermission,)
     lookup_field = 'slug'
 
+    def get_version_keys(self):
+        return (get_label(Genre),)
 
-class ReviewViewSet(PermissionsMixin, viewsets.ModelViewSet):
+
+class ReviewViewSet(
+    PermissionsMixin,
+    CreateThrottleMixin,
+    ConditionalGetMixin,
+    StreamingListMixin,
+    RecordMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
+    record_class = ReviewRecord
+    record_serializer_class = ReviewRecordSerializer
     permission_classes = (CustomReviewCommentPermission,)
+    throttle_scope = 'reviews'
+    keyset_ordering = ('-pub_date', '-id')
+
+    def get_version_keys(self):
+        if self.action == 'list':
+            key = get_key(Review, 'title', self.kwargs['title_id'])
+        else:
+            key = get_key(Review, self.kwargs['pk'])
+        return (key, get_key(UserModel, 'updated'))
 
-    def get_title(self):
-        title_id = self.kwargs.get('title_id')
-        return get_object_or_404(Title, pk=title_id)
+    @cached_property
+    def title(self):
+        return get_object_or_404(Title, pk=self.kwargs.get('title_id'))
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        return self.title.reviews.all()
 
     def perform_create(self, serializer):
-        title = self.get_title()
-        if title.reviews.filter(author=self.request.user).exists():
+        try:
+            serializer.save(author=self.request.user, title=self.title)
+        except IntegrityError:
+            if not self.title.reviews.filter(
+                author=self.request.user
+            ).exists():
+                raise
             raise serializers.ValidationError(
                 'Вы уже оставили отзыв на этот заголовок.'
             )
-        serializer.save(author=self.request.user, title=title)
 
     def update(self, request, *args, **kwargs):
         if request.method == 'PUT':
@@ -109,20 +223,58 @@ class ReviewViewSet(PermissionsMixin, viewsets.ModelViewSet):
         return super().update(request, *args, **kwargs)
 
 
-class CommentViewSet(PermissionsMixin, viewsets.ModelViewSet):
+class CommentViewSet(
+    PermissionsMixin,
+    CreateThrottleMixin,
+    ConditionalGetMixin,
+    StreamingListMixin,
+    RecordMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Comment.objects.all()
     serializer_class = CommentSerializer
+    record_class = CommentRecord
+    record_serializer_class = CommentRecordSerializer
     permission_classes = (CustomReviewCommentPermission,)
+    throttle_scope = 'comments'
+    keyset_ordering = ('-pub_date', '-id')
+
+    def get_version_keys(self):
+        if self.action == 'list':
+            key = get_key(Comment, 'review', self.kwargs['review_id'])
+        else:
+            key = get_key(Comment, self.kwargs['pk'])
+        return (key, get_key(UserModel, 'updated'))
 
-    def get_review(self):
-        title_id = self.kwargs.get('title_id')
-        review_id = self.kwargs.get('review_id')
-        return get_object_or_404(Review, pk=review_id, title__id=title_id)
+    @cached_property
+    def review(self):
+        return get_object_or_404(
+            Review,
+            pk=self.kwargs.get('review_id'),
+            title_id=self.kwargs.get('title_id'),
+        )
+
+    def get_queryset(self):
+        return self.review.comments.all()
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user, review=self.get_review())
+        serializer.save(author=self.request.user, review=self.review)
 
     def update(self, request, *args, **kwargs):
         if request.method == 'PUT':
             return Response(status=status.HTTP_405_METHOD_NOT_ALLOWED)
         return super().update(request, *args, **kwargs)
+
+
+class ExportView(APIView):
+    permission_classes = (AdministratorPermission,)
+
+    def get(self, request, dataset, output_format):
+        response = StreamingHttpResponse(
+            export(dataset, output_format),
+            content_type=f'{FORMATS[output_format]}; charset=utf-8',
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{dataset}.{output_format}"'
+        )
+        return response
@@ -6,3 +6,22 @@ ROLE_FIELD_LENGTH = 9
 
 REVIEW_MIN_RATE = 0
 REVIEW_MAX_RATE = 100
+SCORE_MIN_VALUE = 1
+SCORE_MAX_VALUE = 10
+
+COUNT_EXACT_LIMIT = 10000
+COUNT_CACHE_TIMEOUT = 60 * 60
+CACHE_MAX_AGE = 60
+BULK_CREATE_BATCH_SIZE = 500
+MAX_PAGE_SIZE = 1000
+STREAM_PAGE_SIZE = 100
+STREAM_CHUNK_SIZE = 100
+USER_CACHE_SIZE = 1024
+USER_CACHE_TIMEOUT = 30
+TOKEN_VERSION_TIMEOUT = 60 * 60 * 24
+SUBJECT_FIELD_LENGTH = 255
+CLAIM_TOKEN_LENGTH = 32
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 30
+EMAIL_OUTBOX_LEASE = 5 * 60
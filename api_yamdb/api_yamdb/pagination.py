@@ -0,0 +1,243 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from hashlib import md5
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page,
+    PageNotAnInteger,
+    Paginator,
+)
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from users.permissions import AdministratorPermission
+from .constants import (
+    COUNT_CACHE_TIMEOUT,
+    COUNT_EXACT_LIMIT,
+    MAX_PAGE_SIZE,
+    STREAM_CHUNK_SIZE,
+    STREAM_PAGE_SIZE,
+)
+from .versions import get_label, get_version
+
+
+class CountedPage(Page):
+    more = None
+
+    def has_next(self):
+        if self.more is None:
+            return super().has_next()
+        return self.more
+
+
+class CachedCountPaginator(Paginator):
+    estimated = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        label = get_label(self.object_list.model)
+        try:
+            sql, params = self.object_list.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        query_key = md5(f'{sql}{params}'.encode()).hexdigest()
+        key = f'count:{label}:{get_version(label)}:{query_key}'
+        cached = cache.get(key)
+        if cached is None:
+            count = self.object_list[:COUNT_EXACT_LIMIT + 1].count()
+            cached = (count, count > COUNT_EXACT_LIMIT)
+            cache.set(key, cached, COUNT_CACHE_TIMEOUT)
+        count, self.estimated = cached
+        return count
+
+    def validate_number(self, number):
+        if not (self.count and self.estimated):
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        page = self._get_page(rows[:self.per_page], number, self)
+        page.more = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return CountedPage(*args, **kwargs)
+
+
+class KeysetPagination(PageNumberPagination):
+    django_paginator_class = CachedCountPaginator
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Неверный курсор.'
+
+    def get_page_size(self, request):
+        page_size = super().get_page_size(request)
+        if AdministratorPermission().has_permission(request, None):
+            return page_size
+        return min(page_size, self.page_size)
+
+    def should_stream(self, request, view=None):
+        return (
+            self.cursor_query_param not in request.query_params
+            and self.get_page_size(request) >= STREAM_PAGE_SIZE
+        )
+
+    def stream_queryset(self, queryset, request, view=None):
+        self.use_keyset = False
+        self.request = request
+        paginator = self.django_paginator_class(
+            queryset, self.get_page_size(request)
+        )
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            ))
+        return self.iterate_chunks(self.page.object_list)
+
+    @staticmethod
+    def iterate_chunks(object_list):
+        if not isinstance(object_list, QuerySet):
+            yield from object_list
+            return
+        offset = 0
+        while True:
+            chunk = list(object_list[offset:offset + STREAM_CHUNK_SIZE])
+            yield from chunk
+            if len(chunk) < STREAM_CHUNK_SIZE:
+                return
+            offset += STREAM_CHUNK_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset_ordering = getattr(view, 'keyset_ordering', None)
+        self.use_keyset = bool(
+            self.keyset_ordering
+            and self.cursor_query_param in request.query_params
+        )
+        if not self.use_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+        if position is not None:
+            position = self.parse_position(queryset.model, position)
+        ordering = self.keyset_ordering
+        if reverse:
+            ordering = tuple(self.flip(field) for field in ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(ordering, position))
+
+        page = list(queryset[:page_size + 1])
+        has_more = len(page) > page_size
+        page = page[:page_size]
+        if reverse:
+            page.reverse()
+
+        self.next_position = self.previous_position = None
+        if page and (has_more if not reverse else position is not None):
+            self.next_position = self.get_position(page[-1])
+        if page and (has_more if reverse else position is not None):
+            self.previous_position = self.get_position(page[0])
+        return page
+
+    def get_paginated_response(self, data):
+        if not self.use_keyset:
+            response = super().get_paginated_response(data)
+            if self.page.paginator.estimated:
+                response.data['count_estimated'] = True
+            return response
+        return Response(OrderedDict([
+            ('next', self.get_cursor_link(self.next_position, False)),
+            ('previous', self.get_cursor_link(self.previous_position, True)),
+            ('results', data),
+        ]))
+
+    @staticmethod
+    def flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def after(ordering, position):
+        condition = None
+        for field, value in reversed(tuple(zip(ordering, position))):
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            field = field.lstrip('-')
+            beyond = Q(**{f'{field}__{lookup}': value})
+            if condition is not None:
+                beyond |= Q(**{field: value}) & condition
+            condition = beyond
+        return condition
+
+    def get_position(self, instance):
+        return [
+            getattr(instance, field.lstrip('-'))
+            for field in self.keyset_ordering
+        ]
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode()))
+            position, reverse = cursor['p'], bool(cursor['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if (
+            not isinstance(position, list)
+            or len(position) != len(self.keyset_ordering)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def parse_position(self, model, position):
+        try:
+            position = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.keyset_ordering, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if any(value is None for value in position):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_cursor_link(self, position, reverse):
+        if position is None:
+            return None
+        cursor = json.dumps({'p': position, 'r': reverse}, default=str)
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            urlsafe_b64encode(cursor.encode()).decode(),
+        )
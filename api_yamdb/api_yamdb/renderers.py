@@ -0,0 +1,52 @@
+from django.conf import settings
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+PRETTY_INDENT = 2
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        if renderer_context.get('indent') and settings.BROWSABLE_API_PRETTY:
+            return PRETTY_INDENT
+        return None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(
+            data, default=self.encoder_class().default, option=option
+        )
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+                b'\xe2\x80\xa9', b'\\u2029'
+            )
+        return ret
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    encoder_class = renderers.JSONRenderer.encoder_class
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(
+            data, default=self.encoder_class().default, use_bin_type=True
+        )
@@ -1,4 +1,5 @@
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 
@@ -72,6 +73,17 @@ DATABASES = {
 }
 
 
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.memcached.PyMemcacheCache',
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', '127.0.0.1:11211'),
+    }
+}
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -94,6 +106,7 @@ AUTH_USER_MODEL = 'users.YaUser'
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 EMAIL_HOST_USER = os.environ.get('DOMAIN_NAME')
+EMAIL_OUTBOX_WORKERS = int(os.environ.get('EMAIL_OUTBOX_WORKERS', 2))
 
 
 # Internationalization
@@ -117,8 +130,36 @@ STATICFILES_DIRS = ((BASE_DIR / 'static/'),)
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'api_yamdb.pagination.KeysetPagination',
+    'DEFAULT_RENDERER_CLASSES': (
+        'api_yamdb.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PARSER_CLASSES': (
+        'api_yamdb.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'api_yamdb.throttling.SlidingWindowThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'signup': '5/m',
+        'token': '10/m',
+        'reviews': '20/m',
+        'comments': '60/m',
+    },
     'PAGE_SIZE': 5,
 }
+
+if find_spec('msgpack'):
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] += (
+        'api_yamdb.renderers.MessagePackRenderer',
+    )
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] += (
+        'api_yamdb.parsers.MessagePackParser',
+    )
+
+BROWSABLE_API_PRETTY = True
@@ -0,0 +1,49 @@
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+
+class StreamingListMixin:
+
+    def list(self, request, *args, **kwargs):
+        paginator = self.paginator
+        if (
+            paginator is None
+            or not hasattr(paginator, 'should_stream')
+            or not isinstance(request.accepted_renderer, JSONRenderer)
+            or not paginator.should_stream(request, self)
+        ):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        items = paginator.stream_queryset(queryset, request, self)
+        envelope = paginator.get_paginated_response(None).data
+        return StreamingHttpResponse(
+            self.render_stream(envelope, items),
+            content_type=request.accepted_renderer.media_type,
+        )
+
+    def render_stream(self, envelope, items):
+        renderer = self.request.accepted_renderer
+        context = self.get_renderer_context()
+        media_type = self.request.accepted_media_type
+
+        def render(data):
+            if data is None:
+                return b'null'
+            return renderer.render(data, media_type, context)
+
+        child = self.get_serializer(many=True).child
+        yield b'{'
+        for index, (key, value) in enumerate(envelope.items()):
+            if index:
+                yield b','
+            yield render(key) + b':'
+            if key != 'results':
+                yield render(value)
+                continue
+            yield b'['
+            for position, item in enumerate(items):
+                if position:
+                    yield b','
+                yield render(child.to_representation(item))
+            yield b']'
+        yield b'}'
@@ -0,0 +1,73 @@
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    cache_format = 'throttle:%(scope)s:%(ident)s'
+
+    def __init__(self):
+        pass
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def get_window_key(self, window):
+        return f'{self.key}:{window}'
+
+    def hit(self, window):
+        key = self.get_window_key(window)
+        if cache.add(key, 1, 2 * self.duration):
+            return 1
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, 1, 2 * self.duration)
+            return 1
+
+    def release(self, window):
+        try:
+            cache.decr(self.get_window_key(window))
+        except ValueError:
+            pass
+
+    def allow_request(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        self.scope = getattr(view, 'throttle_scope', self.scope)
+        self.rate = self.get_rate()
+        if self.rate is None:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        self.key = self.get_cache_key(request, view)
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.count = self.hit(window)
+        self.previous = cache.get(self.get_window_key(window - 1), 0)
+        if self.estimate(self.count) <= self.num_requests:
+            return True
+        self.release(window)
+        self.count -= 1
+        return False
+
+    @property
+    def elapsed(self):
+        return self.now % self.duration / self.duration
+
+    def estimate(self, count):
+        return self.previous * (1 - self.elapsed) + count
+
+    def wait(self):
+        free = self.num_requests - 1 - self.count
+        if free >= 0:
+            return (1 - free / self.previous - self.elapsed) * self.duration
+        window_share = 1 - (self.num_requests - 1) / self.count
+        return (1 - self.elapsed + window_share) * self.duration
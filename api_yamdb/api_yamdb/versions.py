@@ -0,0 +1,56 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = 'version:{}'
+MODIFIED_KEY = 'modified:{}'
+STORAGE_CACHE_BACKENDS = (
+    'django.core.cache.backends.db.DatabaseCache',
+    'django.core.cache.backends.filebased.FileBasedCache',
+)
+
+
+def cache_in_memory():
+    return settings.CACHES['default']['BACKEND'] not in STORAGE_CACHE_BACKENDS
+
+
+def get_label(model):
+    return model._meta.label_lower
+
+
+def get_key(model, *parts):
+    return ':'.join((get_label(model), *map(str, parts)))
+
+
+def get_version(key):
+    return cache.get_or_set(VERSION_KEY.format(key), time.time_ns, None)
+
+
+def get_versions(*keys):
+    cache_keys = [VERSION_KEY.format(key) for key in keys]
+    versions = cache.get_many(cache_keys)
+    return [
+        versions[cache_key] if cache_key in versions else get_version(key)
+        for key, cache_key in zip(keys, cache_keys)
+    ]
+
+
+def get_last_modified(*keys):
+    cache_keys = [MODIFIED_KEY.format(key) for key in keys]
+    modified = cache.get_many(cache_keys)
+    for cache_key in cache_keys:
+        if cache_key not in modified:
+            modified[cache_key] = cache.get_or_set(cache_key, time.time, None)
+    return int(max(modified.values()))
+
+
+def bump_versions(*keys):
+    version, now = time.time_ns(), time.time()
+    cache.set_many({VERSION_KEY.format(key): version for key in keys}, None)
+    cache.set_many({MODIFIED_KEY.format(key): now for key in keys}, None)
+
+
+def bump_versions_on_commit(*keys):
+    transaction.on_commit(lambda: bump_versions(*keys))
@@ -1 +1,7 @@
 TEXT_MAX_LENGTH = 50
+TITLE_SEARCH_TABLE = 'reviews_title_fts'
+SEARCH_SUFFIX = '_search'
+TRIGRAM_LENGTH = 3
+SOURCE_MAX_LENGTH = 100
+CHECKSUM_LENGTH = 32
+EXPORT_CHUNK_SIZE = 1000
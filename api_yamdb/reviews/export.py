@@ -0,0 +1,121 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .constants import EXPORT_CHUNK_SIZE
+from .models import Comment, GenreTitle, Review, Title
+
+
+class Echo:
+
+    def write(self, value):
+        return value
+
+
+def iterate_chunks(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    queryset = queryset.order_by('pk').values('pk', *fields)
+    last_pk = 0
+    while True:
+        chunk = list(
+            queryset.filter(pk__gt=last_pk)[:chunk_size].iterator()
+        )
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1]['pk']
+
+
+def export_titles(chunk_size=EXPORT_CHUNK_SIZE):
+    fields = (
+        'name', 'year', 'description', 'category__slug',
+        'score_sum', 'score_count',
+    )
+    for chunk in iterate_chunks(Title.objects, fields, chunk_size):
+        genres = {}
+        for title_id, slug in GenreTitle.objects.filter(
+            title_id__in=[row['pk'] for row in chunk]
+        ).order_by('genre__slug').values_list('title_id', 'genre__slug'):
+            genres.setdefault(title_id, []).append(slug)
+        for row in chunk:
+            yield {
+                'id': row['pk'],
+                'name': row['name'],
+                'year': row['year'],
+                'description': row['description'],
+                'category': row['category__slug'],
+                'genre': genres.get(row['pk'], []),
+                'rating': (
+                    row['score_sum'] // row['score_count']
+                    if row['score_count'] else None
+                ),
+            }
+
+
+def export_reviews(chunk_size=EXPORT_CHUNK_SIZE):
+    fields = ('title_id', 'text', 'author__username', 'score', 'pub_date')
+    for chunk in iterate_chunks(Review.objects, fields, chunk_size):
+        for row in chunk:
+            yield {
+                'id': row['pk'],
+                'title_id': row['title_id'],
+                'text': row['text'],
+                'author': row['author__username'],
+                'score': row['score'],
+                'pub_date': row['pub_date'],
+            }
+
+
+def export_comments(chunk_size=EXPORT_CHUNK_SIZE):
+    fields = ('review_id', 'text', 'author__username', 'pub_date')
+    for chunk in iterate_chunks(Comment.objects, fields, chunk_size):
+        for row in chunk:
+            yield {
+                'id': row['pk'],
+                'review_id': row['review_id'],
+                'text': row['text'],
+                'author': row['author__username'],
+                'pub_date': row['pub_date'],
+            }
+
+
+DATASETS = {
+    'titles': (
+        export_titles,
+        ('id', 'name', 'year', 'description', 'category', 'genre', 'rating'),
+    ),
+    'reviews': (
+        export_reviews,
+        ('id', 'title_id', 'text', 'author', 'score', 'pub_date'),
+    ),
+    'comments': (
+        export_comments,
+        ('id', 'review_id', 'text', 'author', 'pub_date'),
+    ),
+}
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def to_ndjson(rows, fields):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False)
+        yield '\n'
+
+
+def to_csv(rows, fields):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(
+            ','.join(value) if isinstance(value, list) else value
+            for value in row.values()
+        )
+
+
+def export(dataset, output_format, chunk_size=EXPORT_CHUNK_SIZE):
+    rows, fields = DATASETS[dataset]
+    writer = {'ndjson': to_ndjson, 'csv': to_csv}[output_format]
+    return writer(rows(chunk_size), fields)
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from reviews.constants import EXPORT_CHUNK_SIZE
+from reviews.export import DATASETS, FORMATS, export
+
+
+class Command(BaseCommand):
+    help = 'Streams titles, reviews or comments as NDJSON or CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('dataset', choices=DATASETS)
+        parser.add_argument(
+            '--format',
+            dest='output_format',
+            choices=FORMATS,
+            default='ndjson',
+            help='Output format',
+        )
+        parser.add_argument(
+            '--output',
+            help='File to write to, standard output by default',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help='Number of rows fetched per query',
+        )
+
+    def handle(self, *args, **options):
+        lines = export(
+            options['dataset'],
+            options['output_format'],
+            options['chunk_size'],
+        )
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(
+            options['output'], 'w', newline='', encoding='utf-8'
+        ) as output:
+            output.writelines(lines)
+        self.stdout.write(
+            self.style.SUCCESS(f'Exported to {options["output"]}')
+        )
@@ -1,63 +1,403 @@
 import csv
-from django.core.management.base import BaseCommand
-from reviews.models import Category, Genre, Title, User
+import time
+from collections import Counter
+from contextlib import contextmanager
+from hashlib import md5
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+from django.db.models.signals import post_save
+from django.utils.dateparse import parse_datetime
+
+from api_yamdb.constants import BULK_CREATE_BATCH_SIZE
+from api_yamdb.versions import bump_versions, get_key, get_label
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreTitle,
+    ImportRecord,
+    Review,
+    Title,
+    normalize_search,
+)
+
+UserModel = get_user_model()
+
+
+class IdSet:
+
+    def __init__(self, ids=()):
+        self.bits = bytearray()
+        for value in ids:
+            self.add(value)
+
+    def add(self, value):
+        index, bit = divmod(value, 8)
+        if index >= len(self.bits):
+            self.bits.extend(bytes(index - len(self.bits) + 1))
+        self.bits[index] |= 1 << bit
+
+    def __contains__(self, value):
+        index, bit = divmod(value, 8)
+        return index < len(self.bits) and bool(self.bits[index] >> bit & 1)
+
+
+@contextmanager
+def keep_csv_dates(model):
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def get_checksum(row):
+    return md5('\x1f'.join(map(str, row.values())).encode()).hexdigest()
 
 
 class Command(BaseCommand):
-    help = 'Imports data from CSV files into the database'
+    help = 'Imports new and changed rows from CSV files into the database'
+
+    files = (
+        (
+            'users.csv',
+            UserModel,
+            'build_user',
+            ('username', 'email', 'role', 'bio', 'first_name', 'last_name'),
+        ),
+        (
+            'category.csv',
+            Category,
+            'build_category',
+            ('name', 'slug', 'search_name'),
+        ),
+        (
+            'genre.csv',
+            Genre,
+            'build_genre',
+            ('name', 'slug', 'search_name'),
+        ),
+        (
+            'titles.csv',
+            Title,
+            'build_title',
+            ('name', 'year', 'description', 'category'),
+        ),
+        (
+            'genre_title.csv',
+            GenreTitle,
+            'build_genre_title',
+            ('title', 'genre'),
+        ),
+        (
+            'review.csv',
+            Review,
+            'build_review',
+            ('title', 'text', 'author', 'score', 'pub_date'),
+        ),
+        (
+            'comments.csv',
+            Comment,
+            'build_comment',
+            ('review', 'text', 'author', 'pub_date'),
+        ),
+    )
 
-    def handle(self, *args, **kwargs):
-        self.import_categories()
-        self.import_genres()
-        self.import_titles()
-        self.import_users()
+    score_relations = {Review: 'pk', UserModel: 'author'}
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            type=Path,
+            default=settings.BASE_DIR / 'static' / 'data',
+            help='Directory with CSV files',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BULK_CREATE_BATCH_SIZE,
+            help='Number of rows inserted per query',
+        )
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete previously imported rows missing from CSV files',
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        self.ids = {}
+        self.rescored = set()
+        self.commented = set()
+        imported = []
+        for filename, model, builder, fields in self.files:
+            path = options['path'] / filename
+            if not path.exists():
+                self.stdout.write(self.style.WARNING(f'{path} not found'))
+                continue
+            seen = self.import_file(
+                path, model, getattr(self, builder), fields
+            )
+            imported.append((filename, model, seen))
+        if options['delete']:
+            for filename, model, seen in reversed(imported):
+                self.delete_missing(filename, model, seen)
+        self.recount_scores()
+        bump_versions(
+            *(get_label(model) for _, model, _, _ in self.files),
+            *self.get_collection_keys(),
+        )
         self.stdout.write(self.style.SUCCESS('Data imported successfully'))
 
-    def import_categories(self):
-        with open(
-            'path/to/categories.csv', newline='', encoding='utf-8'
-        ) as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                Category.objects.get_or_create(
-                    name=row['name'], slug=row['slug']
-                )
+    def get_ids(self, model):
+        if model not in self.ids:
+            self.ids[model] = IdSet(
+                model.objects.values_list('pk', flat=True).iterator()
+            )
+        return self.ids[model]
+
+    def import_file(self, path, model, build, fields):
+        started = time.monotonic()
+        seen = IdSet()
+        stats = Counter()
+        batch = []
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            with keep_csv_dates(model):
+                for row in csv.DictReader(csvfile):
+                    row_id = int(row['id'])
+                    seen.add(row_id)
+                    batch.append((row_id, row, get_checksum(row)))
+                    if len(batch) >= self.batch_size:
+                        self.save_batch(path.name, model, build, fields,
+                                        batch, stats)
+                        batch = []
+                self.save_batch(path.name, model, build, fields, batch, stats)
+        elapsed = time.monotonic() - started
+        rows = sum(stats.values())
+        self.stdout.write(
+            f'{path.name}: {stats["inserted"]} inserted, '
+            f'{stats["updated"]} updated, {stats["unchanged"]} unchanged, '
+            f'{stats["skipped"]} skipped in {elapsed:.2f}s '
+            f'({rows / max(elapsed, 1e-6):.0f} rows/s)'
+        )
+        return seen
 
-    def import_genres(self):
-        with open(
-            'path/to/genres.csv', newline='', encoding='utf-8'
-        ) as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                Genre.objects.get_or_create(name=row['name'], slug=row['slug'])
-
-    def import_titles(self):
-        with open(
-            'path/to/titles.csv', newline='', encoding='utf-8'
-        ) as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                category = Category.objects.get(slug=row['category'])
-                title = Title.objects.get_or_create(
-                    name=row['name'],
-                    year=row['year'],
-                    description=row['description'],
-                    category=category,
+    def save_batch(self, source, model, build, fields, batch, stats):
+        if not batch:
+            return
+        checksums = dict(ImportRecord.objects.filter(
+            source=source, row_id__in=[row_id for row_id, _, _ in batch]
+        ).values_list('row_id', 'checksum'))
+        changed = []
+        for row_id, row, checksum in batch:
+            if checksums.get(row_id) == checksum:
+                stats['unchanged'] += 1
+                continue
+            instance = build(row)
+            if instance is None:
+                stats['skipped'] += 1
+                continue
+            changed.append((instance, checksum))
+        if not changed:
+            return
+
+        ids = self.get_ids(model)
+        created = [item for item, _ in changed if item.pk not in ids]
+        updated = [item for item, _ in changed if item.pk in ids]
+        try:
+            with transaction.atomic():
+                self.collect_batch_scores(model, changed, updated)
+                self.collect_commented(model, changed, updated)
+                model.objects.bulk_create(created)
+                model.objects.bulk_update(
+                    updated, self.prepare_update(model, updated, fields)
                 )
-                genres = row['genre'].split(',')
-                for genre_slug in genres:
-                    genre = Genre.objects.get(slug=genre_slug)
-                    title.genre.add(genre)
-
-    def import_users(self):
-        with open(
-            'path/to/users.csv', newline='', encoding='utf-8'
-        ) as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                User.objects.get_or_create(
-                    username=row['username'],
-                    email=row['email'],
-                    role=row['role'],
-                    bio=row['bio'],
+                ImportRecord.objects.filter(
+                    source=source, row_id__in=[item.pk for item, _ in changed]
+                ).delete()
+                ImportRecord.objects.bulk_create(
+                    ImportRecord(source=source, row_id=item.pk, checksum=value)
+                    for item, value in changed
                 )
+                for instance in updated:
+                    post_save.send(
+                        sender=model,
+                        instance=instance,
+                        created=False,
+                        update_fields=fields,
+                        raw=False,
+                        using=instance._state.db,
+                    )
+        except DatabaseError as error:
+            raise CommandError(
+                f'Failed to import {model._meta.verbose_name}: {error}'
+            )
+        for instance in created:
+            ids.add(instance.pk)
+        stats['inserted'] += len(created)
+        stats['updated'] += len(updated)
+
+    def delete_missing(self, source, model, seen):
+        missing = [
+            row_id for row_id in ImportRecord.objects.filter(
+                source=source
+            ).values_list('row_id', flat=True).iterator()
+            if row_id not in seen
+        ]
+        for start in range(0, len(missing), self.batch_size):
+            row_ids = missing[start:start + self.batch_size]
+            with transaction.atomic():
+                if model in self.score_relations:
+                    self.collect_rescored(**{
+                        f'{self.score_relations[model]}__in': row_ids
+                    })
+                model.objects.filter(pk__in=row_ids).delete()
+                ImportRecord.objects.filter(
+                    source=source, row_id__in=row_ids
+                ).delete()
+        self.stdout.write(f'{source}: {len(missing)} deleted')
+
+    def prepare_update(self, model, updated, fields):
+        if model is not UserModel or not updated:
+            return fields
+        current = {
+            pk: (role, version)
+            for pk, role, version in UserModel.objects.filter(
+                pk__in=[user.pk for user in updated]
+            ).values_list('pk', 'role', 'token_version')
+        }
+        for user in updated:
+            role, version = current[user.pk]
+            user.token_version = version + (user.role != role)
+        return (*fields, 'token_version')
+
+    def collect_batch_scores(self, model, changed, updated):
+        if model is not Review:
+            return
+        self.collect_rescored(pk__in=[item.pk for item in updated])
+        self.rescored.update(item.title_id for item, _ in changed)
+
+    def collect_commented(self, model, changed, updated):
+        if model is not Comment:
+            return
+        self.commented.update(
+            Comment.objects.filter(
+                pk__in=[item.pk for item in updated]
+            ).values_list('review_id', flat=True).iterator()
+        )
+        self.commented.update(item.review_id for item, _ in changed)
+
+    def collect_rescored(self, **lookup):
+        self.rescored.update(
+            Review.objects.filter(**lookup).values_list(
+                'title_id', flat=True
+            ).iterator()
+        )
+
+    def recount_scores(self):
+        title_ids = sorted(self.rescored)
+        for start in range(0, len(title_ids), self.batch_size):
+            Title.objects.filter(
+                pk__in=title_ids[start:start + self.batch_size]
+            ).recount_scores()
+
+    def get_collection_keys(self):
+        for title_id in self.rescored:
+            yield get_key(Title, title_id)
+            yield get_key(Review, 'title', title_id)
+        for review_id in self.commented:
+            yield get_key(Comment, 'review', review_id)
+
+    def has_ids(self, *references):
+        return all(
+            int(value) in self.get_ids(model) for model, value in references
+        )
+
+    def build_user(self, row):
+        return UserModel(
+            id=int(row['id']),
+            username=row['username'],
+            email=row['email'],
+            role=row['role'] or UserModel.ROLE_USER,
+            bio=row['bio'],
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            password=make_password(None),
+        )
+
+    def build_category(self, row):
+        return Category(
+            id=int(row['id']),
+            name=row['name'],
+            slug=row['slug'],
+            search_name=normalize_search(row['name']),
+        )
+
+    def build_genre(self, row):
+        return Genre(
+            id=int(row['id']),
+            name=row['name'],
+            slug=row['slug'],
+            search_name=normalize_search(row['name']),
+        )
+
+    def build_title(self, row):
+        category_id = int(row['category']) if row['category'] else None
+        if category_id and category_id not in self.get_ids(Category):
+            return None
+        return Title(
+            id=int(row['id']),
+            name=row['name'],
+            year=int(row['year']),
+            description=row.get('description', ''),
+            category_id=category_id,
+        )
+
+    def build_genre_title(self, row):
+        if not self.has_ids(
+            (Title, row['title_id']), (Genre, row['genre_id'])
+        ):
+            return None
+        return GenreTitle(
+            id=int(row['id']),
+            title_id=int(row['title_id']),
+            genre_id=int(row['genre_id']),
+        )
+
+    def build_review(self, row):
+        if not self.has_ids(
+            (Title, row['title_id']), (UserModel, row['author'])
+        ):
+            return None
+        return Review(
+            id=int(row['id']),
+            title_id=int(row['title_id']),
+            text=row['text'],
+            author_id=int(row['author']),
+            score=int(row['score']),
+            pub_date=parse_datetime(row['pub_date']),
+        )
+
+    def build_comment(self, row):
+        if not self.has_ids(
+            (Review, row['review_id']), (UserModel, row['author'])
+        ):
+            return None
+        return Comment(
+            id=int(row['id']),
+            review_id=int(row['review_id']),
+            text=row['text'],
+            author_id=int(row['author']),
+            pub_date=parse_datetime(row['pub_date']),
+        )
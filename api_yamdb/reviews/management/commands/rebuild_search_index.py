@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from reviews.constants import TITLE_SEARCH_TABLE
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index for titles'
+
+    def handle(self, *args, **kwargs):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Search index is only used with SQLite')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {TITLE_SEARCH_TABLE}({TITLE_SEARCH_TABLE}) '
+                "VALUES ('rebuild')"
+            )
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
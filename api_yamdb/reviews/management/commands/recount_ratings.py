@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from reviews.models import Title
+
+
+class Command(BaseCommand):
+    help = 'Recalculates stored title ratings from reviews'
+
+    def handle(self, *args, **kwargs):
+        updated = Title.objects.recount_scores()
+        self.stdout.write(
+            self.style.SUCCESS(f'Ratings recalculated for {updated} titles')
+        )
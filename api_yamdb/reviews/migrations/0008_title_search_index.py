@@ -0,0 +1,71 @@
+from django.db import migrations
+
+CREATE_SEARCH_INDEX = (
+    """
+    CREATE VIRTUAL TABLE reviews_title_fts USING fts5(
+        name,
+        description,
+        content='reviews_title',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER reviews_title_fts_insert AFTER INSERT ON reviews_title
+    BEGIN
+        INSERT INTO reviews_title_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER reviews_title_fts_delete AFTER DELETE ON reviews_title
+    BEGIN
+        INSERT INTO reviews_title_fts(
+            reviews_title_fts, rowid, name, description
+        )
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER reviews_title_fts_update
+    AFTER UPDATE OF name, description ON reviews_title
+    BEGIN
+        INSERT INTO reviews_title_fts(
+            reviews_title_fts, rowid, name, description
+        )
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO reviews_title_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    "INSERT INTO reviews_title_fts(reviews_title_fts) VALUES ('rebuild')",
+)
+
+DROP_SEARCH_INDEX = (
+    'DROP TRIGGER IF EXISTS reviews_title_fts_update',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_delete',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_insert',
+    'DROP TABLE IF EXISTS reviews_title_fts',
+)
+
+
+def run_sqlite(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_sqlite(CREATE_SEARCH_INDEX), run_sqlite(DROP_SEARCH_INDEX)
+        ),
+    ]
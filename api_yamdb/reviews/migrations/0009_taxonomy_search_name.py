@@ -0,0 +1,103 @@
+# Generated by Django 3.2 on 2026-10-18 18:30
+
+from django.db import migrations, models
+
+SEARCH_TABLES = ('reviews_category', 'reviews_genre')
+
+
+def create_search_index(table):
+    search_table = f'{table}_search'
+    return (
+        f"""
+        CREATE VIRTUAL TABLE {search_table} USING fts5(
+            search_name,
+            content='{table}',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+        """,
+        f"""
+        CREATE TRIGGER {search_table}_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {search_table}(rowid, search_name)
+            VALUES (new.id, new.search_name);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {search_table}_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {search_table}({search_table}, rowid, search_name)
+            VALUES ('delete', old.id, old.search_name);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {search_table}_update
+        AFTER UPDATE OF search_name ON {table}
+        BEGIN
+            INSERT INTO {search_table}({search_table}, rowid, search_name)
+            VALUES ('delete', old.id, old.search_name);
+            INSERT INTO {search_table}(rowid, search_name)
+            VALUES (new.id, new.search_name);
+        END
+        """,
+        f"INSERT INTO {search_table}({search_table}) VALUES ('rebuild')",
+    )
+
+
+def drop_search_index(table):
+    search_table = f'{table}_search'
+    return (
+        f'DROP TRIGGER IF EXISTS {search_table}_update',
+        f'DROP TRIGGER IF EXISTS {search_table}_delete',
+        f'DROP TRIGGER IF EXISTS {search_table}_insert',
+        f'DROP TABLE IF EXISTS {search_table}',
+    )
+
+
+def fill_search_names(apps, schema_editor):
+    for model_name in ('Category', 'Genre'):
+        model = apps.get_model('reviews', model_name)
+        items = list(model.objects.all())
+        for item in items:
+            item.search_name = item.name.casefold().replace('ё', 'е')
+        model.objects.bulk_update(items, ('search_name',))
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for table in SEARCH_TABLES:
+        for statement in create_search_index(table):
+            schema_editor.execute(statement)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for table in SEARCH_TABLES:
+        for statement in drop_search_index(table):
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_title_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='search_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=256, verbose_name='Название для поиска'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='genre',
+            name='search_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=256, verbose_name='Название для поиска'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_search_names, migrations.RunPython.noop),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
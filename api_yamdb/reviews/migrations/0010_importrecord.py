@@ -0,0 +1,30 @@
+# Generated by Django 3.2 on 2026-10-18 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0009_taxonomy_search_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=100, verbose_name='Источник')),
+                ('row_id', models.PositiveBigIntegerField(verbose_name='Идентификатор строки')),
+                ('checksum', models.CharField(max_length=32, verbose_name='Контрольная сумма')),
+            ],
+            options={
+                'verbose_name': 'импортированная строка',
+                'verbose_name_plural': 'Импортированные строки',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='importrecord',
+            constraint=models.UniqueConstraint(fields=('source', 'row_id'), name='unique_source_row'),
+        ),
+    ]
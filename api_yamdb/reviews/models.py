@@ -1,7 +1,11 @@
 import datetime
+import re
 
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models.expressions import RawSQL
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from users.models import YaUser
 from api_yamdb.constants import (
@@ -9,8 +13,52 @@ from api_yamdb.constants import (
     SLUG_FIELD_LENGTH,
     REVIEW_MIN_RATE,
     REVIEW_MAX_RATE,
+    SCORE_MIN_VALUE,
+    SCORE_MAX_VALUE,
 )
-from .constants import TEXT_MAX_LENGTH
+from .constants import (
+    CHECKSUM_LENGTH,
+    SEARCH_SUFFIX,
+    SOURCE_MAX_LENGTH,
+    TEXT_MAX_LENGTH,
+    TITLE_SEARCH_TABLE,
+    TRIGRAM_LENGTH,
+)
+
+SCORES = range(SCORE_MIN_VALUE, SCORE_MAX_VALUE + 1)
+
+
+def score_field(score):
+    if score in SCORES:
+        return f'score_{score}'
+    return None
+
+
+def normalize_search(value):
+    return value.casefold().replace('ё', 'е')
+
+
+class TaxonomyQuerySet(models.QuerySet):
+
+    def search(self, query):
+        queryset = self
+        for term in normalize_search(query).split():
+            queryset = queryset.filter(self.match_term(term))
+        return queryset
+
+    def match_term(self, term):
+        if connections[self.db].vendor != 'sqlite':
+            return Q(search_name__contains=term)
+        if len(term) < TRIGRAM_LENGTH:
+            # Trigram index can't match shorter terms: use a prefix range.
+            return Q(
+                search_name__gte=term, search_name__lt=term + '\U0010ffff'
+            )
+        table = self.model._meta.db_table + SEARCH_SUFFIX
+        return Q(pk__in=RawSQL(
+            f'SELECT rowid FROM {table} WHERE {table} MATCH %s',
+            ('"{}"'.format(term.replace('"', '""')),),
+        ))
 
 
 class Category(models.Model):
@@ -22,6 +70,14 @@ class Category(models.Model):
         unique=True,
         verbose_name='Короткое имя в формате slug',
     )
+    search_name = models.CharField(
+        max_length=NAME_FIELD_LENGTH,
+        db_index=True,
+        editable=False,
+        verbose_name='Название для поиска',
+    )
+
+    objects = TaxonomyQuerySet.as_manager()
 
     class Meta:
         ordering = ('name',)
@@ -29,6 +85,10 @@ class Category(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.search_name = normalize_search(self.name)
+        super().save(*args, **kwargs)
+
 
 class Genre(models.Model):
     name = models.CharField(
@@ -39,6 +99,14 @@ class Genre(models.Model):
         unique=True,
         verbose_name='Короткое имя в формате slug',
     )
+    search_name = models.CharField(
+        max_length=NAME_FIELD_LENGTH,
+        db_index=True,
+        editable=False,
+        verbose_name='Название для поиска',
+    )
+
+    objects = TaxonomyQuerySet.as_manager()
 
     class Meta:
         ordering = ('name',)
@@ -46,6 +114,67 @@ class Genre(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.search_name = normalize_search(self.name)
+        super().save(*args, **kwargs)
+
+
+class TitleQuerySet(models.QuerySet):
+
+    def change_score(self, title_id, added=None, removed=None):
+        updates = {
+            'score_sum': F('score_sum'),
+            'score_count': F('score_count'),
+        }
+        for score, step in ((added, 1), (removed, -1)):
+            if score is None:
+                continue
+            updates['score_sum'] += step * score
+            updates['score_count'] += step
+            field = score_field(score)
+            if field:
+                updates[field] = updates.get(field, F(field)) + step
+        return self.filter(pk=title_id).update(**updates)
+
+    def recount_scores(self):
+        reviews = Review.objects.filter(
+            title=OuterRef('pk')
+        ).order_by().values('title')
+        totals = {
+            'score_sum': Sum('score'),
+            'score_count': Count('pk'),
+        }
+        for score in SCORES:
+            totals[score_field(score)] = Count('pk', filter=Q(score=score))
+        return self.update(**{
+            field: Coalesce(
+                Subquery(reviews.annotate(total=total).values('total')), 0
+            )
+            for field, total in totals.items()
+        })
+
+    def search(self, query):
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return self.none()
+        if connections[self.db].vendor != 'sqlite':
+            condition = Q()
+            for term in terms:
+                condition &= (
+                    Q(name__icontains=term) | Q(description__icontains=term)
+                )
+            return self.filter(condition)
+        return self.extra(
+            tables=[TITLE_SEARCH_TABLE],
+            where=[
+                f'{TITLE_SEARCH_TABLE}.rowid = {self.model._meta.db_table}.id',
+                f'{TITLE_SEARCH_TABLE} MATCH %s',
+            ],
+            params=[' '.join(f'"{term}"*' for term in terms)],
+            select={'search_rank': f'bm25({TITLE_SEARCH_TABLE})'},
+            order_by=['search_rank'],
+        )
+
 
 class Title(models.Model):
     name = models.CharField(
@@ -70,15 +199,66 @@ class Title(models.Model):
         Genre, related_name='titles', through='GenreTitle', verbose_name='Жанр'
     )
     description = models.TextField(blank=True, verbose_name='Описание')
+    score_sum = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Сумма оценок'
+    )
+    score_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Количество оценок'
+    )
+    score_1 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 1'
+    )
+    score_2 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 2'
+    )
+    score_3 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 3'
+    )
+    score_4 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 4'
+    )
+    score_5 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 5'
+    )
+    score_6 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 6'
+    )
+    score_7 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 7'
+    )
+    score_8 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 8'
+    )
+    score_9 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 9'
+    )
+    score_10 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name='Оценок 10'
+    )
+
+    objects = TitleQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'произведение'
         verbose_name_plural = 'Произведения'
         ordering = ('name',)
+        indexes = (
+            models.Index(fields=('name', 'id'), name='title_name_id_idx'),
+        )
 
     def __str__(self):
         return self.name
 
+    @property
+    def rating(self):
+        if not self.score_count:
+            return None
+        return self.score_sum // self.score_count
+
+    @property
+    def score_distribution(self):
+        return {score: getattr(self, score_field(score)) for score in SCORES}
+
 
 class GenreTitle(models.Model):
     genre = models.ForeignKey(
@@ -127,10 +307,34 @@ class Review(models.Model):
                 fields=['author', 'title'], name='unique_author_title'
             ),
         )
+        indexes = (
+            models.Index(
+                fields=('title', '-pub_date', '-id'),
+                name='review_title_pub_date_idx',
+            ),
+        )
 
     def __str__(self):
         return self.text[:TEXT_MAX_LENGTH]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_score = (instance.title_id, instance.score)
+        return instance
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_score', None)
+        if self._state.adding:
+            loaded = None
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if loaded != (self.title_id, self.score):
+                if loaded is not None:
+                    Title.objects.change_score(loaded[0], removed=loaded[1])
+                Title.objects.change_score(self.title_id, added=self.score)
+        self._loaded_score = (self.title_id, self.score)
+
 
 class Comment(models.Model):
     review = models.ForeignKey(
@@ -152,6 +356,36 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('review', '-pub_date', '-id'),
+                name='comment_review_pub_date_idx',
+            ),
+        )
 
     def __str__(self):
         return self.text[:TEXT_MAX_LENGTH]
+
+
+class ImportRecord(models.Model):
+    source = models.CharField(
+        max_length=SOURCE_MAX_LENGTH, verbose_name='Источник'
+    )
+    row_id = models.PositiveBigIntegerField(
+        verbose_name='Идентификатор строки'
+    )
+    checksum = models.CharField(
+        max_length=CHECKSUM_LENGTH, verbose_name='Контрольная сумма'
+    )
+
+    class Meta:
+        verbose_name = 'импортированная строка'
+        verbose_name_plural = 'Импортированные строки'
+        constraints = (
+            models.UniqueConstraint(
+                fields=['source', 'row_id'], name='unique_source_row'
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.source}:{self.row_id}'
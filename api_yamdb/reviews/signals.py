@@ -0,0 +1,9 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Review, Title
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_score(sender, instance, **kwargs):
+    Title.objects.change_score(instance.title_id, removed=instance.score)
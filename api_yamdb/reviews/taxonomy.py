@@ -0,0 +1,40 @@
+from threading import Lock
+
+from api_yamdb.versions import get_label, get_version
+from .models import Category, Genre
+
+
+class TaxonomySnapshot:
+
+    def __init__(self, version, items):
+        self.version = version
+        self.items = tuple(items)
+        self.by_slug = {item.slug: item for item in self.items}
+
+
+class TaxonomyCache:
+
+    def __init__(self, model):
+        self.model = model
+        self.label = get_label(model)
+        self.snapshot = None
+        self.lock = Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def get(self):
+        version = get_version(self.label)
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self.lock:
+            if self.snapshot is None or self.snapshot.version != version:
+                self.snapshot = TaxonomySnapshot(
+                    version, self.model.objects.all()
+                )
+            return self.snapshot
+
+
+categories = TaxonomyCache(Category)
+genres = TaxonomyCache(Genre)
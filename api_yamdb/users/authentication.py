@@ -0,0 +1,168 @@
+import time
+from collections import OrderedDict
+from copy import copy
+from threading import Lock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api_yamdb.constants import (
+    TOKEN_VERSION_TIMEOUT,
+    USER_CACHE_SIZE,
+    USER_CACHE_TIMEOUT,
+)
+from api_yamdb.versions import cache_in_memory
+
+UserModel = get_user_model()
+
+
+def get_token_version_key(user_id):
+    return f'token_version:{user_id}'
+
+
+def remember_token_version(user_id, version):
+    cache.set(get_token_version_key(user_id), version, TOKEN_VERSION_TIMEOUT)
+
+
+def forget_token_version(user_id):
+    cache.delete(get_token_version_key(user_id))
+
+
+class ClaimsAccessToken(AccessToken):
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['role'] = user.role
+        token['is_superuser'] = user.is_superuser
+        token['token_version'] = user.token_version
+        remember_token_version(user.pk, user.token_version)
+        return token
+
+
+class ClaimsUser(SimpleLazyObject):
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, token, load):
+        self.__dict__['_token'] = token
+        super().__init__(load)
+
+    @property
+    def pk(self):
+        return self._token[api_settings.USER_ID_CLAIM]
+
+    id = pk
+
+    @property
+    def role(self):
+        return self._token['role']
+
+    @property
+    def is_superuser(self):
+        return self._token['is_superuser']
+
+    @property
+    def is_user(self):
+        return self.role == UserModel.ROLE_USER
+
+    @property
+    def is_moderator(self):
+        return self.role == UserModel.ROLE_MODERATOR
+
+    @property
+    def is_admin(self):
+        return self.role == UserModel.ROLE_ADMIN
+
+
+class TokenUserCache:
+
+    def __init__(self, maxsize, timeout):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, raw_token):
+        with self.lock:
+            entry = self.entries.get(raw_token)
+            if entry is None:
+                return None
+            expires, validated_token, user = entry
+            if expires <= time.monotonic():
+                del self.entries[raw_token]
+                return None
+            self.entries.move_to_end(raw_token)
+            return validated_token, user
+
+    def set(self, raw_token, validated_token, user=None):
+        now = time.monotonic()
+        expires = min(
+            now + self.timeout,
+            now + validated_token.get('exp', 0) - time.time(),
+        )
+        with self.lock:
+            self.entries[raw_token] = (expires, validated_token, user)
+            self.entries.move_to_end(raw_token)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            for raw_token in [
+                raw_token
+                for raw_token, (_, token, _) in self.entries.items()
+                if token.get(api_settings.USER_ID_CLAIM) == user_id
+            ]:
+                del self.entries[raw_token]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+user_cache = TokenUserCache(USER_CACHE_SIZE, USER_CACHE_TIMEOUT)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        cached = user_cache.get(raw_token)
+        if cached is None:
+            validated_token, user = self.get_validated_token(raw_token), None
+            user_cache.set(raw_token, validated_token)
+        else:
+            validated_token, user = cached
+        if user is not None:
+            return copy(user), validated_token
+        if cache_in_memory() and self.has_current_claims(validated_token):
+            return ClaimsUser(
+                validated_token,
+                lambda: self.load_user(raw_token, validated_token),
+            ), validated_token
+        return self.load_user(raw_token, validated_token), validated_token
+
+    @staticmethod
+    def has_current_claims(validated_token):
+        version = validated_token.get('token_version')
+        return version is not None and version == cache.get(
+            get_token_version_key(
+                validated_token.get(api_settings.USER_ID_CLAIM)
+            )
+        )
+
+    def load_user(self, raw_token, validated_token):
+        user = self.get_user(validated_token)
+        remember_token_version(user.pk, user.token_version)
+        user_cache.set(raw_token, validated_token, user)
+        return copy(user)
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api_yamdb.constants import EMAIL_OUTBOX_BATCH_SIZE
+from users.outbox import deliver_pending
+
+
+class Command(BaseCommand):
+    help = 'Delivers queued emails from the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=EMAIL_OUTBOX_BATCH_SIZE,
+            help='Number of emails sent per batch',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the outbox',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=10,
+            help='Seconds between polls in loop mode',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, _ = deliver_pending(options['batch_size'])
+            self.stdout.write(f'{sent} emails sent')
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-18 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_remove_yauser_confirmation_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='yauser',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Версия токена'),
+        ),
+    ]
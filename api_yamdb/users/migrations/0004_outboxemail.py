@@ -0,0 +1,33 @@
+# Generated by Django 3.2 on 2026-10-18 18:50
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_yauser_token_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Тема')),
+                ('message', models.TextField(verbose_name='Текст')),
+                ('from_email', models.CharField(blank=True, max_length=254, verbose_name='Отправитель')),
+                ('recipient', models.EmailField(max_length=254, verbose_name='Получатель')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Попыток отправки')),
+                ('next_attempt_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, null=True, verbose_name='Следующая попытка')),
+                ('claimed_until', models.DateTimeField(null=True, verbose_name='Захвачено до')),
+                ('claim_token', models.CharField(blank=True, db_index=True, max_length=32, verbose_name='Токен захвата')),
+            ],
+            options={
+                'verbose_name': 'письмо в очереди',
+                'verbose_name_plural': 'Очередь писем',
+                'ordering': ('next_attempt_at', 'id'),
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2 on 2026-10-18 18:59
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def clear_duplicate_emails(apps, schema_editor):
+    YaUser = apps.get_model('users', 'YaUser')
+    duplicates = YaUser.objects.exclude(email='').order_by().values(
+        'email'
+    ).annotate(users=Count('id')).filter(users__gt=1).values_list(
+        'email', flat=True
+    )
+    for email in duplicates:
+        first = YaUser.objects.filter(email=email).order_by('id').first()
+        YaUser.objects.filter(email=email).exclude(pk=first.pk).update(
+            email=''
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_outboxemail'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='yauser',
+            constraint=models.UniqueConstraint(condition=models.Q(_negated=True, email=''), fields=('email',), name='unique_user_email'),
+        ),
+    ]
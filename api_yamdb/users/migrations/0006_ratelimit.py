@@ -0,0 +1,28 @@
+# Generated by Django 3.2 on 2026-10-18 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_yauser_unique_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RateLimit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True, verbose_name='Ключ')),
+                ('window', models.PositiveBigIntegerField(verbose_name='Окно')),
+                ('count', models.PositiveIntegerField(default=1, verbose_name='Запросов в окне')),
+                ('previous', models.PositiveIntegerField(default=0, verbose_name='Запросов в прошлом окне')),
+                ('expires_at', models.PositiveBigIntegerField(db_index=True, verbose_name='Действует до')),
+            ],
+            options={
+                'verbose_name': 'лимит запросов',
+                'verbose_name_plural': 'Лимиты запросов',
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 3.2 on 2026-10-18 19:55
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_ratelimit'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='RateLimit',
+        ),
+    ]
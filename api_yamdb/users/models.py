@@ -1,8 +1,14 @@
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 
-from api_yamdb.constants import ROLE_FIELD_LENGTH
+from api_yamdb.constants import (
+    CLAIM_TOKEN_LENGTH,
+    EMAIL_FIELD_LENGTH,
+    ROLE_FIELD_LENGTH,
+    SUBJECT_FIELD_LENGTH,
+)
 
 
 class YaUser(AbstractUser):
@@ -26,6 +32,13 @@ class YaUser(AbstractUser):
         choices=ROLE_CHOICES,
         default=ROLE_USER
     )
+    token_version = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Версия токена',
+    )
+
+    CLAIM_FIELDS = ('role', 'is_superuser', 'is_active')
 
     @property
     def is_user(self):
@@ -43,15 +56,79 @@ class YaUser(AbstractUser):
         if self.is_superuser and self.is_admin:
             raise ValidationError('Суперпользователь — всегда администратор!')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if set(cls.CLAIM_FIELDS).issubset(field_names):
+            instance._loaded_claims = instance.get_claims()
+        return instance
+
+    def get_claims(self):
+        return tuple(getattr(self, field) for field in self.CLAIM_FIELDS)
+
     def save(self, *args, **kwargs):
         if self.is_superuser:
             self.role = self.ROLE_ADMIN
+        loaded = getattr(self, '_loaded_claims', None)
+        if loaded is not None and loaded != self.get_claims():
+            self.token_version += 1
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {
+                    *kwargs['update_fields'], 'token_version'
+                }
         super().save(*args, **kwargs)
+        self._loaded_claims = self.get_claims()
 
     class Meta:
         verbose_name = 'пользователь'
         verbose_name_plural = 'Пользователи'
         ordering = ('username',)
+        constraints = (
+            models.UniqueConstraint(
+                fields=('email',),
+                condition=~models.Q(email=''),
+                name='unique_user_email',
+            ),
+        )
 
     def __str__(self):
         return self.username
+
+
+class OutboxEmail(models.Model):
+    subject = models.CharField(
+        max_length=SUBJECT_FIELD_LENGTH, verbose_name='Тема'
+    )
+    message = models.TextField(verbose_name='Текст')
+    from_email = models.CharField(
+        max_length=EMAIL_FIELD_LENGTH, blank=True, verbose_name='Отправитель'
+    )
+    recipient = models.EmailField(
+        max_length=EMAIL_FIELD_LENGTH, verbose_name='Получатель'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name='Попыток отправки'
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        null=True,
+        db_index=True,
+        verbose_name='Следующая попытка',
+    )
+    claimed_until = models.DateTimeField(
+        null=True, verbose_name='Захвачено до'
+    )
+    claim_token = models.CharField(
+        max_length=CLAIM_TOKEN_LENGTH,
+        blank=True,
+        db_index=True,
+        verbose_name='Токен захвата',
+    )
+
+    class Meta:
+        verbose_name = 'письмо в очереди'
+        verbose_name_plural = 'Очередь писем'
+        ordering = ('next_attempt_at', 'id')
+
+    def __str__(self):
+        return f'{self.recipient}: {self.subject}'
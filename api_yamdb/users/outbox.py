@@ -0,0 +1,145 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock, Timer
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.mail import get_connection, send_mass_mail
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from api_yamdb.constants import (
+    EMAIL_OUTBOX_BATCH_SIZE,
+    EMAIL_OUTBOX_LEASE,
+    EMAIL_OUTBOX_MAX_ATTEMPTS,
+    EMAIL_OUTBOX_RETRY_DELAY,
+)
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_email(subject, message, from_email, recipient):
+    email = OutboxEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email or '',
+        recipient=recipient,
+    )
+    transaction.on_commit(outbox.wake)
+    return email
+
+
+def claim_batch(batch_size=EMAIL_OUTBOX_BATCH_SIZE):
+    now = timezone.now()
+    available = Q(next_attempt_at__lte=now) & (
+        Q(claimed_until__isnull=True) | Q(claimed_until__lt=now)
+    )
+    email_ids = list(OutboxEmail.objects.filter(available).values_list(
+        'pk', flat=True
+    )[:batch_size])
+    if not email_ids:
+        return []
+    token = uuid4().hex
+    OutboxEmail.objects.filter(available, pk__in=email_ids).update(
+        claim_token=token,
+        claimed_until=now + timedelta(seconds=EMAIL_OUTBOX_LEASE),
+    )
+    return list(OutboxEmail.objects.filter(claim_token=token))
+
+
+def get_retry_delay(attempts):
+    return EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+
+
+def deliver_batch(connection, batch_size=EMAIL_OUTBOX_BATCH_SIZE):
+    emails = claim_batch(batch_size)
+    if not emails:
+        return 0, None
+    try:
+        connection.open()
+        send_mass_mail(
+            (
+                (
+                    email.subject,
+                    email.message,
+                    email.from_email or None,
+                    [email.recipient],
+                )
+                for email in emails
+            ),
+            connection=connection,
+        )
+    except Exception:
+        logger.exception('Failed to deliver %d outbox emails', len(emails))
+        now = timezone.now()
+        for email in emails:
+            email.attempts += 1
+            email.claimed_until = None
+            email.next_attempt_at = (
+                now + timedelta(seconds=get_retry_delay(email.attempts))
+                if email.attempts < EMAIL_OUTBOX_MAX_ATTEMPTS else None
+            )
+        OutboxEmail.objects.bulk_update(
+            emails, ('attempts', 'claimed_until', 'next_attempt_at')
+        )
+        return 0, get_retry_delay(emails[0].attempts)
+    OutboxEmail.objects.filter(pk__in=[email.pk for email in emails]).delete()
+    return len(emails), None
+
+
+def deliver_pending(batch_size=EMAIL_OUTBOX_BATCH_SIZE):
+    sent, retry_delay = 0, None
+    connection = get_connection()
+    try:
+        while retry_delay is None:
+            delivered, retry_delay = deliver_batch(connection, batch_size)
+            if not delivered:
+                break
+            sent += delivered
+    finally:
+        connection.close()
+    return sent, retry_delay
+
+
+class Outbox:
+
+    def __init__(self):
+        self.executor = None
+        self.pending = 0
+        self.lock = Lock()
+
+    def wake(self):
+        workers = settings.EMAIL_OUTBOX_WORKERS
+        if not workers:
+            deliver_pending()
+            return
+        with self.lock:
+            if self.pending >= workers:
+                return
+            self.pending += 1
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    workers, thread_name_prefix='outbox'
+                )
+        self.executor.submit(self.drain)
+
+    def drain(self):
+        with self.lock:
+            self.pending -= 1
+        try:
+            _, retry_delay = deliver_pending()
+        except Exception:
+            logger.exception('Outbox delivery failed')
+            retry_delay = EMAIL_OUTBOX_RETRY_DELAY
+        finally:
+            connections.close_all()
+        if retry_delay is not None:
+            timer = Timer(retry_delay, self.wake)
+            timer.daemon = True
+            timer.start()
+
+
+outbox = Outbox()
@@ -19,7 +19,7 @@ class AuthenticatedPermission(BasePermission):
 class AuthorPermission(AuthenticatedPermission):
 
     def has_object_permission(self, request, view, obj):
-        return obj.author == request.user
+        return obj.author_id == request.user.pk
 
 
 class ModeratorPermission(AuthenticatedPermission):
@@ -55,4 +55,4 @@ class CustomReviewCommentPermission(BasePermission):
         ]:
             return True
 
-        return obj.author == request.user
+        return obj.author_id == request.user.pk
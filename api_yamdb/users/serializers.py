@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
-from rest_framework.validators import UniqueTogetherValidator
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
 
 from api_yamdb.constants import (
     EMAIL_FIELD_LENGTH,
@@ -9,6 +11,11 @@ from api_yamdb.constants import (
 
 UserModel = get_user_model()
 
+unique_email = UniqueValidator(
+    queryset=UserModel.objects.exclude(email=''),
+    message='Email уже используется!',
+)
+
 
 class _BaseUserSerializer(serializers.ModelSerializer):
     username = serializers.CharField(
@@ -27,7 +34,8 @@ class _BaseUserSerializer(serializers.ModelSerializer):
 class UserSerializer(_BaseUserSerializer):
     email = serializers.EmailField(
         max_length=EMAIL_FIELD_LENGTH,
-        required=False
+        required=False,
+        validators=(unique_email,)
     )
     first_name = serializers.CharField(
         max_length=USERNAME_FIELD_LENGTH,
@@ -60,7 +68,8 @@ class AdminSerializer(UserSerializer):
     )
     email = serializers.EmailField(
         max_length=EMAIL_FIELD_LENGTH,
-        required=True
+        required=True,
+        validators=(unique_email,)
     )
     role = serializers.ChoiceField(
         required=False,
@@ -101,29 +110,27 @@ class SignupSerializer(_BaseUserSerializer):
         fields = ('username', 'email')
 
     def validate(self, data):
-        username = data.get('username')
-        email = data.get('email')
-
-        user = self._get_user(email=email)
-        if user and user.username != username:
-            raise serializers.ValidationError(
-                'Email уже используется!')
-
-        user = self._get_user(username=username)
-        if user and user.email != email:
+        username, email = data['username'], data['email']
+        users = list(UserModel.objects.filter(
+            Q(username=username) | Q(email=email)
+        )[:2])
+        if any(user.username != username for user in users):
+            raise serializers.ValidationError('Email уже используется!')
+        if any(user.email != email for user in users):
             raise serializers.ValidationError(
                 'Имя пользователя уже используется!')
-
+        self.existing_user = users[0] if users else None
         return data
 
     def create(self, validated_data):
-        user = self._get_user(**validated_data)
-        if not user:
-            user = UserModel.objects.create(**validated_data)
-        return user
-
-    @staticmethod
-    def _get_user(**kwargs):
-        user = UserModel.objects.filter(**kwargs)
-        if user.exists():
-            return user.first()
+        if self.existing_user is not None:
+            return self.existing_user
+        try:
+            with transaction.atomic():
+                return UserModel.objects.create(**validated_data)
+        except IntegrityError:
+            user = UserModel.objects.filter(**validated_data).first()
+            if user is None:
+                raise serializers.ValidationError(
+                    'Имя пользователя или email уже используется!')
+            return user
@@ -0,0 +1,34 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import (
+    forget_token_version,
+    remember_token_version,
+    user_cache,
+)
+
+UserModel = get_user_model()
+
+
+def refresh_cached_user(user_id, token_version=None):
+    user_cache.invalidate(user_id)
+    if token_version is None:
+        forget_token_version(user_id)
+    else:
+        remember_token_version(user_id, token_version)
+
+
+@receiver(post_save, sender=UserModel)
+def update_cached_user(sender, instance, **kwargs):
+    transaction.on_commit(partial(
+        refresh_cached_user, instance.pk, instance.token_version
+    ))
+
+
+@receiver(post_delete, sender=UserModel)
+def delete_cached_user(sender, instance, **kwargs):
+    transaction.on_commit(partial(refresh_cached_user, instance.pk))
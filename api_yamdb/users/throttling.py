@@ -0,0 +1,9 @@
+from api_yamdb.throttling import SlidingWindowThrottle
+
+
+class SignupThrottle(SlidingWindowThrottle):
+    scope = 'signup'
+
+
+class TokenThrottle(SlidingWindowThrottle):
+    scope = 'token'
@@ -1,16 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.shortcuts import get_object_or_404
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, throttle_classes
 from rest_framework import filters, status
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework import views, viewsets
 
 from api_yamdb.settings import EMAIL_HOST_USER
+from api_yamdb.streaming import StreamingListMixin
 
+from .authentication import ClaimsAccessToken
+from .outbox import enqueue_email
 from .permissions import (
     AdministratorPermission,
     AuthenticatedPermission,
@@ -20,29 +20,31 @@ from .serializers import (
     SignupSerializer,
     UserSerializer,
 )
+from .throttling import SignupThrottle, TokenThrottle
 
 UserModel = get_user_model()
 
 
 @api_view(['POST'])
+@throttle_classes((SignupThrottle,))
 def auth_signup(request):
     serializer = SignupSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.save()
         token = default_token_generator.make_token(user)
 
-        send_mail(
+        enqueue_email(
             subject='Confirmation Code',
             message=token,
             from_email=EMAIL_HOST_USER,
-            recipient_list=[user.email],
-            fail_silently=False,
+            recipient=user.email,
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(['POST'])
+@throttle_classes((TokenThrottle,))
 def auth_token(request):
     username = request.data.get('username')
     confirmation_code = request.data.get('confirmation_code')
@@ -52,18 +54,17 @@ def auth_token(request):
     user = get_object_or_404(UserModel, username=username)
 
     if default_token_generator.check_token(user, token=confirmation_code):
-        refresh = RefreshToken.for_user(user)
-        data = {'token': str(refresh.access_token)}
+        data = {'token': str(ClaimsAccessToken.for_user(user))}
         return Response(data, status=status.HTTP_200_OK)
     return Response(status=status.HTTP_400_BAD_REQUEST)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(StreamingListMixin, viewsets.ModelViewSet):
     queryset = UserModel.objects.all()
     lookup_field = 'username'
     serializer_class = AdminSerializer
     permission_classes = (AdministratorPermission,)
-    pagination_class = PageNumberPagination
+    keyset_ordering = ('username', 'id')
     filter_backends = (filters.SearchFilter,)
     search_fields = ('username',)
 
@@ -96,19 +97,12 @@ class MeViewSet(views.APIView):
     permission_classes = (AuthenticatedPermission,)
 
     def get(self, request):
-        user = get_object_or_404(
-            UserModel,
-            username=request.user.username
-        )
-        serializer = AdminSerializer(user)
-        self.check_object_permissions(request, user)
+        serializer = AdminSerializer(request.user)
+        self.check_object_permissions(request, request.user)
         return Response(serializer.data)
 
     def patch(self, request):
-        user = get_object_or_404(
-            UserModel,
-            username=request.user.username
-        )
+        user = get_object_or_404(UserModel, pk=request.user.pk)
         serializer = UserSerializer(user, data=request.data)
         if serializer.is_valid(raise_exception=True):
             serializer.save()
@@ -1,6 +1,7 @@
 import os
 import sys
 
+import pytest
 from django.utils.version import get_version
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -33,3 +34,40 @@ assert get_version() < '4.0.0', 'Пожалуйста, используйте в
 pytest_plugins = [
     'tests.fixtures.fixture_user',
 ]
+
+
+@pytest.fixture(scope='session', autouse=True)
+def configured_cache():
+    from django.core.cache import CacheHandler
+    from django.test.utils import override_settings
+
+    try:
+        cache = CacheHandler().create_connection('default')
+        cache.set('cache_probe', 1)
+        available = cache.get('cache_probe') == 1
+        cache.close()
+    except Exception:
+        available = False
+    if available:
+        yield
+        return
+    with override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+    from users.authentication import user_cache
+
+    cache.clear()
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def eager_outbox(settings):
+    settings.EMAIL_OUTBOX_WORKERS = 0
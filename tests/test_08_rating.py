@@ -0,0 +1,110 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08RatingAPI:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    TITLE_SCORES_URL_TEMPLATE = '/api/v1/titles/{title_id}/scores/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_rating(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['rating']
+
+    def test_01_rating_follows_review_changes(self, admin_client, admin,
+                                              user_client, user):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        title_id = titles[0]['id']
+        assert self.get_rating(admin_client, title_id) == 5, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'создании отзыва.'
+        )
+
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[1]['id']
+            ),
+            data={'score': 10}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_rating(admin_client, title_id) == 7, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'изменении оценки в отзыве.'
+        )
+
+        response = admin_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_rating(admin_client, title_id) == 10, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'удалении отзыва.'
+        )
+
+        user.delete()
+        assert self.get_rating(admin_client, title_id) is None, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'каскадном удалении отзывов.'
+        )
+
+    def test_02_recount_ratings(self, admin_client, admin):
+        from reviews.models import Title
+
+        _, titles = create_reviews(admin_client, {admin: admin_client})
+        Title.objects.update(score_sum=0, score_count=0, score_5=0)
+        call_command('recount_ratings')
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.score_sum, title.score_count, title.score_5) == (5, 1, 1), (
+            'Проверьте, что команда `recount_ratings` восстанавливает '
+            'сохранённый рейтинг произведений по отзывам.'
+        )
+        assert Title.objects.get(pk=titles[1]['id']).rating is None
+
+    def test_03_title_scores(self, client, admin_client, admin, user_client,
+                             user):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        title_id = titles[0]['id']
+        user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[1]['id']
+            ),
+            data={'score': 9}
+        )
+        url = self.TITLE_SCORES_URL_TEMPLATE.format(title_id=title_id)
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос неавторизованного пользователя к '
+            f'`{self.TITLE_SCORES_URL_TEMPLATE}` возвращает ответ со '
+            'статусом 200.'
+        )
+        expected_scores = {str(score): 0 for score in range(1, 11)}
+        expected_scores.update({'5': 1, '9': 1})
+        assert response.json() == {
+            'id': title_id,
+            'rating': 7,
+            'score_count': 2,
+            'scores': expected_scores,
+        }, (
+            f'Проверьте, что ответ на GET-запрос к '
+            f'`{self.TITLE_SCORES_URL_TEMPLATE}` содержит распределение '
+            'оценок произведения.'
+        )
+        response = client.post(url)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,89 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09QueriesAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def create_more_titles(self, count):
+        from reviews.models import Category, Genre, GenreTitle, Title
+
+        category = Category.objects.first()
+        genres = list(Genre.objects.all())
+        for idx in range(count):
+            title = Title.objects.create(
+                name=f'Произведение {idx}', year=2000, category=category
+            )
+            GenreTitle.objects.bulk_create(
+                GenreTitle(genre=genre, title=title) for genre in genres
+            )
+
+    @pytest.mark.parametrize('extra_titles', (0, 3, 20))
+    def test_01_titles_list_query_count(self, client, admin_client,
+                                        django_assert_max_num_queries,
+                                        extra_titles):
+        create_titles(admin_client)
+        self.create_more_titles(extra_titles)
+        with django_assert_max_num_queries(3):
+            response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        for title in response.json()['results']:
+            assert title['genre'] and title['category'], (
+                f'Проверьте, что GET-запрос к `{self.TITLES_URL}` '
+                'возвращает жанры и категорию каждого произведения.'
+            )
+
+    @pytest.mark.parametrize('url', ('/api/v1/categories/', '/api/v1/genres/'))
+    def test_02_taxonomy_list_from_snapshot(self, client, admin_client,
+                                            django_assert_num_queries, url):
+        create_titles(admin_client)
+        client.get(url)
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        count = response.json()['count']
+
+        admin_client.post(url, data={'name': 'Новый', 'slug': 'new'})
+        response = client.get(url)
+        assert response.json()['count'] == count + 1, (
+            f'Проверьте, что после изменений список `{url}` обновляется.'
+        )
+        admin_client.delete(f'{url}new/')
+        response = client.get(url)
+        assert response.json()['count'] == count
+
+    def test_03_title_filter_and_post_resolve_slugs(
+            self, client, admin_client, django_assert_num_queries):
+        titles, categories, genres = create_titles(admin_client)
+        client.get(self.TITLES_URL, {'genre': genres[0]['slug']})
+        with django_assert_num_queries(3):
+            response = client.get(
+                self.TITLES_URL,
+                {'genre': genres[0]['slug'], 'category': 'films'}
+            )
+        assert [title['id'] for title in response.json()['results']] == [
+            titles[0]['id']
+        ]
+        response = client.get(self.TITLES_URL, {'genre': 'unknown'})
+        assert response.json()['results'] == []
+
+        response = admin_client.post(self.TITLES_URL, data={
+            'name': 'Чужой',
+            'year': 1979,
+            'genre': [genre['slug'] for genre in genres],
+            'category': categories[0]['slug'],
+        })
+        assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.post(self.TITLES_URL, data={
+            'name': 'Чужие',
+            'year': 1986,
+            'genre': ['unknown'],
+            'category': categories[0]['slug'],
+        })
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'genre' in response.json()
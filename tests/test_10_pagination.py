@@ -0,0 +1,152 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10KeysetPaginationAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+    USERS_URL = '/api/v1/users/'
+
+    def create_more_titles(self, count, prefix='Произведение'):
+        from reviews.models import Title
+
+        Title.objects.bulk_create(
+            Title(name=f'{prefix} {idx:02}', year=2000)
+            for idx in range(count)
+        )
+
+    def walk(self, client, url):
+        names = []
+        response = client.get(url, {'cursor': ''})
+        while True:
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert set(data) == {'next', 'previous', 'results'}, (
+                f'Проверьте, что при запросе к `{url}` с параметром `cursor` '
+                'ответ содержит ключи `next`, `previous` и `results`.'
+            )
+            names.extend(title['name'] for title in data['results'])
+            if not data['next']:
+                return names, data
+            response = client.get(data['next'])
+
+    def test_01_titles_cursor_walk(self, client, admin_client):
+        create_titles(admin_client)
+        self.create_more_titles(11)
+        names, _ = self.walk(client, self.TITLES_URL)
+        assert names == sorted(names) and len(names) == 13, (
+            f'Проверьте, что курсорная пагинация `{self.TITLES_URL}` '
+            'возвращает все произведения ровно один раз по порядку.'
+        )
+
+    def test_02_cursor_stable_under_inserts(self, client, admin_client):
+        self.create_more_titles(10)
+        response = client.get(self.TITLES_URL, {'cursor': ''})
+        first_page = response.json()
+        self.create_more_titles(3, prefix='Алиса')
+        self.create_more_titles(3, prefix='Ясон')
+        response = client.get(first_page['next'])
+        second_page = response.json()
+        seen = [title['name'] for title in first_page['results']]
+        seen += [title['name'] for title in second_page['results']]
+        assert len(seen) == len(set(seen)), (
+            'Проверьте, что вставка новых записей не приводит к повторам '
+            'при курсорной пагинации.'
+        )
+
+        response = client.get(second_page['previous'])
+        assert response.json()['results'] == first_page['results'], (
+            'Проверьте, что ссылка `previous` курсорной пагинации '
+            'возвращает предыдущую страницу.'
+        )
+
+    def test_03_invalid_cursor(self, client, admin_client):
+        import json
+        from base64 import urlsafe_b64encode
+
+        response = client.get(self.TITLES_URL, {'cursor': 'broken'})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+        titles, _, _ = create_titles(admin_client)
+        reviews_url = f'{self.TITLES_URL}{titles[0]["id"]}/reviews/'
+        for url, position in (
+            (self.TITLES_URL, ['a', 'b']),
+            (self.TITLES_URL, [None, None]),
+            (self.TITLES_URL, [['a'], {'b': 1}]),
+            (reviews_url, ['not a date', 1]),
+            (reviews_url, ['2020-01-01T00:00:00Z', 'b']),
+        ):
+            cursor = urlsafe_b64encode(
+                json.dumps({'p': position, 'r': False}).encode()
+            ).decode()
+            response = client.get(url, {'cursor': cursor})
+            assert response.status_code == HTTPStatus.NOT_FOUND, (
+                f'Проверьте, что запрос к `{url}` с курсором {position} '
+                'возвращает ответ со статусом 404.'
+            )
+
+    def test_04_page_numbers_by_default(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == 2
+
+    def test_05_cached_count(self, client, admin_client,
+                             django_assert_num_queries):
+        create_titles(admin_client)
+        client.get(self.TITLES_URL)
+        with django_assert_num_queries(2):
+            response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == 2, (
+            f'Проверьте, что повторный GET-запрос к `{self.TITLES_URL}` '
+            'берёт количество объектов из кеша.'
+        )
+
+        title_id = response.json()['results'][0]['id']
+        admin_client.delete(f'{self.TITLES_URL}{title_id}/')
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == 1, (
+            f'Проверьте, что изменение произведений сбрасывает кеш '
+            f'количества объектов для `{self.TITLES_URL}`.'
+        )
+
+    def test_06_estimated_count(self, client, admin_client, monkeypatch):
+        monkeypatch.setattr('api_yamdb.pagination.COUNT_EXACT_LIMIT', 3)
+        self.create_more_titles(12)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.TITLES_URL)
+        data = response.json()
+        assert data['count'] == 4 and data['count_estimated'] is True, (
+            'Проверьте, что для больших выборок количество объектов '
+            'ограничено и помечается как приблизительное.'
+        )
+        assert all(
+            'LIMIT' in query['sql']
+            for query in context.captured_queries
+            if 'COUNT(' in query['sql']
+        ), (
+            'Проверьте, что для больших выборок не выполняется полный '
+            'подсчёт объектов.'
+        )
+
+        names = [title['name'] for title in data['results']]
+        while data['next']:
+            data = client.get(data['next']).json()
+            names.extend(title['name'] for title in data['results'])
+        assert len(names) == len(set(names)) == 12, (
+            'Проверьте, что страницы за пределами приблизительного '
+            'количества объектов доступны по ссылкам `next`.'
+        )
+        response = client.get(self.TITLES_URL, {'page': 4})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'] == []
+
+        monkeypatch.setattr('api_yamdb.pagination.COUNT_EXACT_LIMIT', 20)
+        admin_client.delete(f'{self.TITLES_URL}{data["results"][0]["id"]}/')
+        data = client.get(self.TITLES_URL).json()
+        assert data['count'] == 11 and 'count_estimated' not in data
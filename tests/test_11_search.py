@@ -0,0 +1,81 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11SearchAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'search': query})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`search` возвращает ответ со статусом 200.'
+        )
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_title_search(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        assert self.search(client, 'терминат') == ['Терминатор'], (
+            f'Проверьте, что поиск по `{self.TITLES_URL}` находит '
+            'произведения по началу слова в названии без учёта регистра.'
+        )
+        assert self.search(client, 'yippie') == ['Крепкий орешек'], (
+            f'Проверьте, что поиск по `{self.TITLES_URL}` учитывает '
+            'описание произведения.'
+        )
+        assert self.search(client, '"(*') == []
+
+        admin_client.patch(
+            f'{self.TITLES_URL}{titles[0]["id"]}/', data={'name': 'Чужой'}
+        )
+        assert self.search(client, 'терминатор') == []
+        assert self.search(client, 'чужой') == ['Чужой'], (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'произведения.'
+        )
+        admin_client.delete(f'{self.TITLES_URL}{titles[0]["id"]}/')
+        assert self.search(client, 'чужой') == []
+
+    def test_02_search_ranking(self, client):
+        from reviews.models import Title
+
+        Title.objects.create(name='Дом', description='Дом у реки, дом в лесу')
+        Title.objects.create(name='Река', description='Где-то стоит дом')
+        assert self.search(client, 'дом') == ['Дом', 'Река'], (
+            'Проверьте, что результаты поиска отсортированы по '
+            'релевантности.'
+        )
+        call_command('rebuild_search_index')
+        assert self.search(client, 'реки') == ['Дом']
+
+    @pytest.mark.parametrize('url', ('/api/v1/categories/', '/api/v1/genres/'))
+    def test_03_taxonomy_search(self, client, admin_client, url):
+        for name, slug in (
+            ('Фильм', 'film'), ('Драма', 'drama'), ('Ёлки', 'yolki')
+        ):
+            admin_client.post(url, data={'name': name, 'slug': slug})
+
+        def search(query):
+            response = client.get(url, {'search': query})
+            assert response.status_code == HTTPStatus.OK
+            return [item['slug'] for item in response.json()['results']]
+
+        assert search('фильм') == ['film'], (
+            f'Проверьте, что поиск по `{url}` не зависит от регистра '
+            'кириллицы.'
+        )
+        assert search('РАМ') == ['drama'], (
+            f'Проверьте, что поиск по `{url}` находит подстроку названия.'
+        )
+        assert search('ел') == search('ЁЛ') == ['yolki'], (
+            f'Проверьте, что поиск по `{url}` не различает `е` и `ё`.'
+        )
+        assert search('ф') == ['film']
+        assert search('"') == []
+        assert len(search('')) == 3
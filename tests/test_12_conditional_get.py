@@ -0,0 +1,114 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews, create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ConditionalGetAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def get_etag(self, client, url):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.has_header('ETag'), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'заголовок `ETag`.'
+        )
+        return response['ETag']
+
+    def test_01_not_modified(self, client, admin_client,
+                             django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        urls = (
+            self.TITLES_URL,
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            '/api/v1/genres/',
+        )
+        for url in urls:
+            etag = self.get_etag(client, url)
+            with django_assert_num_queries(0):
+                response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                f'Проверьте, что GET-запрос к `{url}` с актуальным '
+                '`If-None-Match` возвращает ответ со статусом 304 без '
+                'обращений к базе данных.'
+            )
+            assert 'public' in response['Cache-Control']
+            assert response.has_header('Last-Modified')
+
+    def test_02_etag_changes_on_write(self, client, admin_client, admin,
+                                      user_client, user):
+        _, titles = create_reviews(admin_client, {admin: admin_client})
+        title_id = titles[0]['id']
+        urls = (
+            self.TITLES_URL,
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id),
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id),
+        )
+        etags = [self.get_etag(client, url) for url in urls]
+        other_title_reviews = self.REVIEWS_URL_TEMPLATE.format(
+            title_id=titles[1]['id']
+        )
+        other_etag = self.get_etag(client, other_title_reviews)
+
+        create_single_review(user_client, title_id, 'Отлично', 10)
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что после добавления отзыва GET-запрос к '
+                f'`{url}` возвращает новые данные.'
+            )
+        response = client.get(
+            other_title_reviews, HTTP_IF_NONE_MATCH=other_etag
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        response = user_client.get(self.TITLES_URL)
+        assert 'private' in response['Cache-Control']
+
+    def test_03_cache_backend_warnings(self, monkeypatch):
+        from django.conf import settings
+
+        from api.checks import check_shared_cache
+
+        for backend, expected, message in (
+            (
+                'django.core.cache.backends.locmem.LocMemCache',
+                ['api.W001'],
+                'для кеша внутри процесса выводится предупреждение: версии '
+                'данных не будут общими для процессов',
+            ),
+            (
+                'django.core.cache.backends.db.DatabaseCache',
+                ['api.W002'],
+                'для кеша в базе данных выводится предупреждение: каждое '
+                'чтение версии станет запросом к базе',
+            ),
+            (
+                'django.core.cache.backends.memcached.PyMemcacheCache',
+                [],
+                'для memcached предупреждений нет',
+            ),
+        ):
+            monkeypatch.setattr(settings, 'CACHES', {'default': {
+                'BACKEND': backend, 'LOCATION': 'cache',
+            }})
+            assert [
+                warning.id for warning in check_shared_cache(None)
+            ] == expected, f'Проверьте, что {message}.'
+
+    def test_04_configured_cache_in_memory(self):
+        from api_yamdb import settings as project_settings
+
+        assert project_settings.CACHES['default']['BACKEND'].startswith(
+            'django.core.cache.backends.memcached.'
+        ), (
+            'Проверьте, что по умолчанию версии данных хранятся в memcached, '
+            'а не в базе данных.'
+        )
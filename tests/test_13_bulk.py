@@ -0,0 +1,127 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13BulkTitlesAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+    BULK_URL = '/api/v1/titles/bulk/'
+
+    def get_payload(self, count, genres, categories):
+        return [
+            {
+                'name': f'Произведение {idx}',
+                'year': 2000 + idx % 20,
+                'genre': [genre['slug'] for genre in genres[:idx % 3 + 1]],
+                'category': categories[idx % 2]['slug'],
+            }
+            for idx in range(count)
+        ]
+
+    def test_01_bulk_create(self, client, admin_client,
+                            django_assert_max_num_queries):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        payload = self.get_payload(50, genres, categories)
+        admin_client.get(self.TITLES_URL, {'genre': genres[0]['slug']})
+        with django_assert_max_num_queries(8):
+            response = admin_client.post(
+                self.BULK_URL, data=payload, format='json'
+            )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к `{self.BULK_URL}` '
+            'с корректными данными возвращает ответ со статусом 201.'
+        )
+        data = response.json()
+        assert [item['name'] for item in data] == [
+            item['name'] for item in payload
+        ]
+        assert set(data[4]['genre']) == set(payload[4]['genre'])
+
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == 50, (
+            'Проверьте, что созданные пакетом произведения доступны в '
+            f'списке `{self.TITLES_URL}`.'
+        )
+        response = client.get(self.TITLES_URL, {'search': 'произведение'})
+        assert response.json()['count'] == 50
+
+    def test_02_bulk_errors(self, admin_client, user_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        payload = self.get_payload(3, genres, categories)
+        payload[1]['genre'] = ['unknown']
+        payload[2]['name'] = ''
+        response = admin_client.post(
+            self.BULK_URL, data=payload, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()
+        assert errors[0] == {} and 'genre' in errors[1], (
+            f'Проверьте, что POST-запрос к `{self.BULK_URL}` возвращает '
+            'ошибки для каждого элемента.'
+        )
+        assert 'name' in errors[2]
+        assert admin_client.get(self.TITLES_URL).json()['count'] == 0
+
+        response = user_client.post(
+            self.BULK_URL, data=payload, format='json'
+        )
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_03_bulk_create_after_delete(self, admin_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        payload = self.get_payload(3, genres, categories)
+        response = admin_client.post(
+            self.BULK_URL, data=payload, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        deleted_id = response.json()[-1]['id']
+        admin_client.delete(f'{self.TITLES_URL}{deleted_id}/')
+
+        payload = self.get_payload(2, genres, categories)
+        for idx, item in enumerate(payload):
+            item['name'] = f'Новое произведение {idx}'
+        response = admin_client.post(
+            self.BULK_URL, data=payload, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        data = response.json()
+        assert deleted_id not in [item['id'] for item in data], (
+            'Проверьте, что пакетное создание не переиспользует '
+            'идентификаторы удалённых произведений.'
+        )
+        for item in data:
+            response = admin_client.get(f'{self.TITLES_URL}{item["id"]}/')
+            assert response.json()['name'] == item['name'], (
+                'Проверьте, что пакетное создание возвращает идентификаторы '
+                'созданных произведений.'
+            )
+
+    def test_04_bulk_taxonomy_read_once(self, admin_client, monkeypatch):
+        from reviews import taxonomy
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        payload = self.get_payload(100, genres, categories)
+        calls = []
+
+        def get_version(key):
+            calls.append(key)
+            return version(key)
+
+        version = taxonomy.get_version
+        monkeypatch.setattr(taxonomy, 'get_version', get_version)
+        response = admin_client.post(
+            self.BULK_URL, data=payload, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert sorted(calls) == ['reviews.category', 'reviews.genre'], (
+            f'Проверьте, что POST-запрос к `{self.BULK_URL}` читает версии '
+            'категорий и жанров один раз за запрос.'
+        )
@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14ImportCSV:
+
+    def test_01_import_static_data(self, client):
+        from reviews.models import Comment, GenreTitle, Review, Title
+
+        out = StringIO()
+        call_command('import_csv', batch_size=10, stdout=out)
+        assert 'rows/s' in out.getvalue()
+        assert Title.objects.count() == 32
+        assert GenreTitle.objects.count() == 42
+        assert Review.objects.count() == 72
+        assert Comment.objects.count() == 3
+        assert Review.objects.get(pk=1).pub_date == datetime(
+            2019, 9, 24, 21, 8, 21, 567000, tzinfo=timezone.utc
+        ), 'Проверьте, что при импорте сохраняется дата публикации из CSV.'
+        assert Title.objects.get(pk=1).rating == 10, (
+            'Проверьте, что после импорта рейтинг произведений пересчитан.'
+        )
+        response = client.get('/api/v1/titles/')
+        assert response.json()['count'] == 32
+
+    def test_02_import_skips_missing_references(self, tmp_path):
+        from reviews.models import Review
+
+        (tmp_path / 'review.csv').write_text(
+            'id,title_id,text,author,score,pub_date\n'
+            '1,100,Текст,1,5,2020-01-01T00:00:00Z\n',
+            encoding='utf-8',
+        )
+        out = StringIO()
+        call_command('import_csv', path=tmp_path, stdout=out)
+        assert '1 skipped' in out.getvalue()
+        assert not Review.objects.exists()
+
+    def test_03_reimport_is_incremental(self, tmp_path):
+        from reviews.models import Genre
+
+        path = tmp_path / 'genre.csv'
+        path.write_text(
+            'id,name,slug\n1,Драма,drama\n2,Комедия,comedy\n',
+            encoding='utf-8',
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        out = StringIO()
+        call_command('import_csv', path=tmp_path, stdout=out)
+        assert '0 inserted, 0 updated, 2 unchanged' in out.getvalue(), (
+            'Проверьте, что повторный импорт пропускает неизменённые строки.'
+        )
+
+        path.write_text(
+            'id,name,slug\n1,Трагедия,drama\n', encoding='utf-8'
+        )
+        out = StringIO()
+        call_command('import_csv', path=tmp_path, delete=True, stdout=out)
+        assert '1 updated' in out.getvalue()
+        assert '1 deleted' in out.getvalue()
+        assert list(Genre.objects.values_list('name', flat=True)) == [
+            'Трагедия'
+        ], 'Проверьте, что импорт обновляет и удаляет строки.'
+
+    def test_04_reimport_recounts_changed_titles(self, tmp_path):
+        from reviews.models import Title
+
+        (tmp_path / 'users.csv').write_text(
+            'id,username,email,role,bio,first_name,last_name\n'
+            '1,reader,reader@yamdb.fake,user,,,\n',
+            encoding='utf-8',
+        )
+        (tmp_path / 'titles.csv').write_text(
+            'id,name,year,category\n1,Первое,2000,\n2,Второе,2001,\n',
+            encoding='utf-8',
+        )
+        reviews = tmp_path / 'review.csv'
+        reviews.write_text(
+            'id,title_id,text,author,score,pub_date\n'
+            '1,1,Текст,1,5,2020-01-01T00:00:00Z\n'
+            '2,2,Текст,1,7,2020-01-01T00:00:00Z\n',
+            encoding='utf-8',
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        assert Title.objects.get(pk=2).rating == 7
+        Title.objects.filter(pk=2).update(score_sum=70, score_count=10)
+
+        reviews.write_text(
+            'id,title_id,text,author,score,pub_date\n'
+            '1,1,Текст,1,9,2020-01-01T00:00:00Z\n'
+            '2,2,Текст,1,7,2020-01-01T00:00:00Z\n',
+            encoding='utf-8',
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        assert Title.objects.get(pk=1).rating == 9
+        assert Title.objects.get(pk=2).score_count == 10, (
+            'Проверьте, что повторный импорт пересчитывает рейтинг только '
+            'у произведений с изменёнными отзывами.'
+        )
+
+        reviews.write_text(
+            'id,title_id,text,author,score,pub_date\n', encoding='utf-8'
+        )
+        call_command('import_csv', path=tmp_path, delete=True,
+                     stdout=StringIO())
+        assert Title.objects.get(pk=1).rating is None
+        assert Title.objects.get(pk=2).score_count == 0, (
+            'Проверьте, что после удаления отзывов рейтинг пересчитан.'
+        )
+
+    def test_05_reimport_refreshes_collection_etags(self, client, tmp_path):
+        (tmp_path / 'users.csv').write_text(
+            'id,username,email,role,bio,first_name,last_name\n'
+            '1,reader,reader@yamdb.fake,user,,,\n'
+            '2,writer,writer@yamdb.fake,user,,,\n',
+            encoding='utf-8',
+        )
+        (tmp_path / 'titles.csv').write_text(
+            'id,name,year,category\n1,Первое,2000,\n', encoding='utf-8'
+        )
+        reviews = tmp_path / 'review.csv'
+        comments = tmp_path / 'comments.csv'
+        reviews.write_text(
+            'id,title_id,text,author,score,pub_date\n'
+            '1,1,Текст,1,5,2020-01-01T00:00:00Z\n',
+            encoding='utf-8',
+        )
+        comments.write_text(
+            'id,review_id,text,author,pub_date\n', encoding='utf-8'
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        urls = (
+            '/api/v1/titles/1/reviews/',
+            '/api/v1/titles/1/reviews/1/comments/',
+            '/api/v1/titles/1/',
+        )
+        etags = [client.get(url)['ETag'] for url in urls]
+
+        reviews.write_text(
+            'id,title_id,text,author,score,pub_date\n'
+            '1,1,Текст,1,5,2020-01-01T00:00:00Z\n'
+            '2,1,Текст,2,9,2020-01-01T00:00:00Z\n',
+            encoding='utf-8',
+        )
+        comments.write_text(
+            'id,review_id,text,author,pub_date\n'
+            '1,1,Текст,2,2020-01-01T00:00:00Z\n',
+            encoding='utf-8',
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == 200, (
+                f'Проверьте, что после импорта новых записей `{url}` не '
+                'возвращает ответ 304 со старым ETag.'
+            )
+        assert client.get(urls[0]).json()['count'] == 2
+        assert client.get(urls[2]).json()['rating'] == 7
@@ -0,0 +1,59 @@
+import csv
+import json
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15Export:
+
+    EXPORT_URL = '/api/v1/export/titles.{}'
+
+    def test_01_export_endpoint(self, client, user_client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.EXPORT_URL.format('ndjson')
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(url).status_code == HTTPStatus.FORBIDDEN, (
+            f'Проверьте, что `{url}` доступен только администратору.'
+        )
+
+        response = admin_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming, (
+            f'Проверьте, что `{url}` отдаёт данные потоком.'
+        )
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert [row['name'] for row in rows] == [
+            title['name'] for title in titles
+        ]
+        assert set(rows[0]['genre']) == set(titles[0]['genre'])
+        assert rows[0]['category'] == titles[0]['category']
+
+        response = admin_client.get(self.EXPORT_URL.format('csv'))
+        content = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+        assert rows[1]['name'] == titles[1]['name']
+        assert rows[1]['genre'] == titles[1]['genre'][0]
+
+    def test_02_export_command(self, admin_client, tmp_path):
+        titles, _, _ = create_titles(admin_client)
+        output = tmp_path / 'titles.ndjson'
+        call_command(
+            'export_data', 'titles', output=str(output), chunk_size=1,
+            stdout=StringIO(),
+        )
+        rows = [
+            json.loads(line)
+            for line in output.read_text(encoding='utf-8').splitlines()
+        ]
+        assert [row['id'] for row in rows] == [
+            title['id'] for title in titles
+        ], 'Проверьте, что экспорт обходит таблицу пакетами без пропусков.'
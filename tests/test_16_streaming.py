@@ -0,0 +1,65 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16StreamingList:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def create_titles(self, admin_client, count):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        response = admin_client.post(
+            f'{self.TITLES_URL}bulk/',
+            data=[
+                {
+                    'name': f'Произведение {idx:03}',
+                    'year': 2000,
+                    'genre': [genres[idx % 3]['slug']],
+                    'category': categories[idx % 2]['slug'],
+                }
+                for idx in range(count)
+            ],
+            format='json',
+        )
+        assert response.status_code == HTTPStatus.CREATED
+
+    def test_01_large_page_is_streamed(self, admin_client, monkeypatch):
+        from api_yamdb import pagination
+
+        self.create_titles(admin_client, 120)
+        response = admin_client.get(self.TITLES_URL, {'page_size': 150})
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming, (
+            'Проверьте, что большие страницы списка отдаются потоком.'
+        )
+        streamed = b''.join(response.streaming_content)
+
+        monkeypatch.setattr(pagination, 'STREAM_PAGE_SIZE', 1000)
+        response = admin_client.get(self.TITLES_URL, {'page_size': 150})
+        assert not response.streaming
+        assert streamed == response.content, (
+            'Проверьте, что потоковый ответ совпадает с обычным.'
+        )
+        data = response.json()
+        assert data['count'] == 120
+        assert len(data['results']) == 120
+
+    def test_02_small_page_is_not_streamed(self, client, admin_client):
+        self.create_titles(admin_client, 10)
+        response = client.get(self.TITLES_URL, {'page_size': 3, 'page': 2})
+        assert not response.streaming
+        assert len(response.json()['results']) == 3
+        response = client.get(self.TITLES_URL, {'page_size': 150})
+        assert not response.streaming
+        assert len(response.json()['results']) == 5, (
+            'Проверьте, что увеличенный размер страницы доступен только '
+            'администратору.'
+        )
+        response = admin_client.get('/api/v1/users/', {'page_size': 100})
+        assert response.streaming
+        assert b'"results":[' in b''.join(response.streaming_content)
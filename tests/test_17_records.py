@@ -0,0 +1,74 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17RecordReadPath:
+
+    def render(self, serializer, instance, many=False):
+        return JSONRenderer().render(serializer(instance, many=many).data)
+
+    def test_01_records_match_model_serializers(
+        self, client, admin_client, admin, moderator, user, moderator_client,
+        user_client, django_assert_max_num_queries
+    ):
+        from api.serializers import (
+            CommentSerializer,
+            ReviewSerializer,
+            TitleSerializer,
+        )
+        from reviews.models import Comment, Review, Title
+
+        authors_map = {
+            admin: admin_client,
+            moderator: moderator_client,
+            user: user_client,
+        }
+        comments, reviews, titles = create_comments(admin_client, authors_map)
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        titles_url = '/api/v1/titles/'
+        reviews_url = f'{titles_url}{title_id}/reviews/'
+        comments_url = f'{reviews_url}{review_id}/comments/'
+
+        response = client.get(titles_url, {'page_size': 10})
+        expected = self.render(TitleSerializer, Title.objects.all(), True)
+        assert response.content.endswith(expected + b'}'), (
+            'Проверьте, что быстрый путь чтения произведений отдаёт те же '
+            'данные, что и TitleSerializer.'
+        )
+        response = client.get(f'{titles_url}{title_id}/')
+        assert response.content == self.render(
+            TitleSerializer, Title.objects.get(pk=title_id)
+        )
+
+        with django_assert_max_num_queries(4):
+            response = client.get(reviews_url, {'page_size': 10})
+        expected = self.render(
+            ReviewSerializer,
+            Review.objects.filter(title_id=title_id).order_by('-pub_date'),
+            True,
+        )
+        assert response.content.endswith(expected + b'}')
+        response = client.get(f'{reviews_url}{review_id}/')
+        assert response.content == self.render(
+            ReviewSerializer, Review.objects.get(pk=review_id)
+        )
+
+        response = client.get(f'{comments_url}{comments[0]["id"]}/')
+        assert response.content == self.render(
+            CommentSerializer, Comment.objects.get(pk=comments[0]['id'])
+        )
+
+    def test_02_benchmark_command(self, admin_client, admin, user,
+                                  user_client):
+        create_comments(admin_client, {admin: admin_client, user: user_client})
+        out = StringIO()
+        call_command('benchmark_reads', repeat=2, stdout=out)
+        output = out.getvalue()
+        for name in ('titles', 'reviews', 'comments'):
+            assert f'{name}: model' in output
@@ -0,0 +1,74 @@
+import datetime
+import decimal
+from http import HTTPStatus
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18FastJSON:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+
+    def get_data(self):
+        return {
+            'name': 'Фильм\u2028',
+            'count': 1,
+            'scores': {1: 2},
+            'rating': None,
+            'items': [1.5, True],
+        }
+
+    def test_01_renderer_matches_stdlib(self, monkeypatch):
+        from api_yamdb import renderers
+
+        data = self.get_data()
+        expected = JSONRenderer().render(data)
+        assert renderers.FastJSONRenderer().render(data) == expected, (
+            'Проверьте, что быстрый рендерер выдаёт тот же JSON, что и '
+            'стандартный.'
+        )
+        rendered = renderers.FastJSONRenderer().render({
+            'price': decimal.Decimal('1.50'),
+            'date': datetime.datetime(
+                2020, 1, 1, tzinfo=datetime.timezone.utc
+            ),
+        })
+        assert rendered == b'{"price":1.5,"date":"2020-01-01T00:00:00Z"}'
+
+        monkeypatch.setattr(renderers, 'orjson', None)
+        assert renderers.FastJSONRenderer().render(data) == expected
+
+    def test_02_pretty_only_for_browsable_api(self, client, admin_client):
+        admin_client.post(
+            self.CATEGORIES_URL,
+            data={'name': 'Фильм', 'slug': 'films'},
+            format='json',
+        )
+        response = client.get(
+            self.CATEGORIES_URL, HTTP_ACCEPT='application/json; indent=4'
+        )
+        assert b'\n' not in response.content
+        response = client.get(self.CATEGORIES_URL, HTTP_ACCEPT='text/html')
+        assert response.status_code == HTTPStatus.OK
+        assert '\n  &quot;count&quot;' in response.content.decode(), (
+            'Проверьте, что в browsable API ответ отформатирован.'
+        )
+
+    def test_03_parser(self, admin_client):
+        response = admin_client.post(
+            self.CATEGORIES_URL,
+            data='{"name": "Книга", "slug": "books"}',
+            content_type='application/json',
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.post(
+            self.CATEGORIES_URL,
+            data='{"name": ',
+            content_type='application/json',
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что некорректный JSON возвращает ответ со статусом '
+            '400.'
+        )
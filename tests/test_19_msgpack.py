@@ -0,0 +1,64 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_comments
+
+msgpack = pytest.importorskip('msgpack')
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19MessagePack:
+
+    MEDIA_TYPE = 'application/msgpack'
+
+    def test_01_msgpack_matches_json(self, client, admin_client, admin,
+                                     user, user_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        urls = (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+            f'{reviews[0]["id"]}/comments/',
+            '/api/v1/users/me/',
+        )
+        for url in urls:
+            response = admin_client.get(url, HTTP_ACCEPT=self.MEDIA_TYPE)
+            assert response.status_code == HTTPStatus.OK
+            assert response['Content-Type'] == self.MEDIA_TYPE, (
+                f'Проверьте, что `{url}` поддерживает формат MessagePack.'
+            )
+            assert msgpack.unpackb(response.content) == admin_client.get(
+                url
+            ).json(), (
+                f'Проверьте, что MessagePack-ответ `{url}` совпадает с JSON.'
+            )
+
+    def test_02_msgpack_request_body(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/categories/',
+            data=msgpack.packb({'name': 'Фильм', 'slug': 'films'}),
+            content_type=self.MEDIA_TYPE,
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что API принимает тело запроса в формате '
+            'MessagePack.'
+        )
+        assert response.json() == {'name': 'Фильм', 'slug': 'films'}
+        response = admin_client.post(
+            '/api/v1/categories/',
+            data=b'\xc1',
+            content_type=self.MEDIA_TYPE,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_03_benchmark_command(self, admin_client, admin, user,
+                                  user_client):
+        create_comments(admin_client, {admin: admin_client, user: user_client})
+        out = StringIO()
+        call_command('benchmark_formats', repeat=2, stdout=out)
+        assert 'titles msgpack' in out.getvalue()
@@ -0,0 +1,71 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20SparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_titles_fields(self, client, admin_client, admin, user,
+                              user_client):
+        _, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(
+                self.TITLES_URL, {'fields': 'id,name,rating'}
+            )
+        assert response.status_code == HTTPStatus.OK
+        for title in response.json()['results']:
+            assert set(title) == {'id', 'name', 'rating'}, (
+                f'Проверьте, что параметр `fields` в `{self.TITLES_URL}` '
+                'оставляет в ответе только запрошенные поля.'
+            )
+        sql = ' '.join(query['sql'] for query in context.captured_queries)
+        assert 'description' not in sql, (
+            'Проверьте, что невостребованные поля не выбираются из базы.'
+        )
+        assert 'genretitle' not in sql, (
+            'Проверьте, что жанры не загружаются, если они не запрошены.'
+        )
+
+        response = client.get(
+            f'{self.TITLES_URL}{titles[0]["id"]}/',
+            {'exclude': 'description,genre'},
+        )
+        assert set(response.json()) == {
+            'id', 'name', 'year', 'rating', 'category'
+        }
+        assert response.json()['rating'] == 5
+
+        response = client.get(self.TITLES_URL, {'fields': 'id,secret'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что неизвестные поля в параметре `fields` приводят '
+            'к ответу со статусом 400.'
+        )
+
+    def test_02_other_viewsets(self, client, admin_client, admin, user,
+                               user_client):
+        _, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        url = f'{self.TITLES_URL}{titles[0]["id"]}/reviews/'
+        response = client.get(
+            url, {'fields': 'score', 'cursor': '', 'page_size': 1}
+        )
+        assert response.json()['results'] == [{'score': 5}]
+        response = client.get(response.json()['next'])
+        assert response.json()['results'] == [{'score': 5}], (
+            'Проверьте, что параметр `fields` работает вместе с курсорной '
+            'пагинацией.'
+        )
+
+        response = client.get('/api/v1/categories/', {'fields': 'slug'})
+        results = response.json()['results']
+        assert results and all(set(item) == {'slug'} for item in results)
@@ -0,0 +1,61 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21AuthenticationCache:
+
+    ME_URL = '/api/v1/users/me/'
+
+    def test_01_user_loaded_once(self, user_client,
+                                 django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = user_client.get(self.ME_URL)
+        assert response.status_code == HTTPStatus.OK
+        with django_assert_num_queries(0):
+            response = user_client.get(self.ME_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что аутентифицированный пользователь кешируется '
+            'между запросами.'
+        )
+
+    def test_02_role_change_invalidates_cache(self, admin_client, user,
+                                              user_client):
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+        response = admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'admin'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.OK
+        ), 'Проверьте, что смена роли сбрасывает кеш пользователя.'
+        assert user_client.get(self.ME_URL).json()['role'] == 'admin'
+
+        user_client.patch(self.ME_URL, data={'bio': 'Новая биография'})
+        assert user_client.get(self.ME_URL).json()['bio'] == (
+            'Новая биография'
+        )
+
+        admin_client.delete(f'/api/v1/users/{user.username}/')
+        assert user_client.get(self.ME_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), 'Проверьте, что удалённый пользователь не остаётся в кеше.'
+
+    def test_03_me_update_saves_current_row(self, django_user_model, admin,
+                                            admin_client):
+        assert admin_client.get(self.ME_URL).json()['role'] == 'admin'
+        django_user_model.objects.filter(pk=admin.pk).update(
+            role='user', token_version=1
+        )
+        response = admin_client.patch(self.ME_URL, data={'bio': 'Новая'})
+        assert response.status_code == HTTPStatus.OK
+        admin.refresh_from_db()
+        assert (admin.role, admin.token_version, admin.bio) == (
+            'user', 1, 'Новая'
+        ), (
+            f'Проверьте, что PATCH-запрос к `{self.ME_URL}` изменяет текущую '
+            'запись пользователя, а не устаревшую копию из кеша.'
+        )
@@ -0,0 +1,117 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22ClaimsPermissions:
+
+    def get_client(self, user):
+        from django.contrib.auth.tokens import default_token_generator
+
+        response = APIClient().post('/api/v1/auth/token/', data={
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user),
+        })
+        assert response.status_code == HTTPStatus.OK
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {response.json()["token"]}'
+        )
+        return client
+
+    def user_queries(self, context):
+        return [
+            query for query in context.captured_queries
+            if 'FROM "users_yauser"' in query['sql']
+        ]
+
+    def test_01_permissions_from_claims(self, admin, user):
+        admin_client = self.get_client(admin)
+        user_client = self.get_client(user)
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.post(
+                '/api/v1/categories/', data={'name': 'Фильм', 'slug': 'films'}
+            )
+            assert response.status_code == HTTPStatus.CREATED
+            response = user_client.get('/api/v1/titles/')
+            assert response.status_code == HTTPStatus.OK
+            response = user_client.delete('/api/v1/categories/films/')
+            assert response.status_code == HTTPStatus.FORBIDDEN
+        assert not self.user_queries(context), (
+            'Проверьте, что права доступа проверяются по данным токена без '
+            'запроса пользователя из базы.'
+        )
+
+        response = user_client.get('/api/v1/users/me/')
+        assert response.json()['username'] == user.username
+
+    def test_02_role_change_revalidates_token(self, admin, user):
+        admin_client = self.get_client(admin)
+        user_client = self.get_client(user)
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+        admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'admin'}
+        )
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.OK
+        ), 'Проверьте, что смена роли делает старые токены недействительными.'
+
+        user_client.patch(
+            f'/api/v1/users/{admin.username}/', data={'role': 'user'}
+        )
+        assert admin_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        ), 'Проверьте, что понижение роли сразу лишает прав доступа.'
+
+    def test_03_bulk_role_change_revokes_claims(self, tmp_path):
+        from io import StringIO
+
+        from django.contrib.auth import get_user_model
+        from django.core.management import call_command
+
+        path = tmp_path / 'users.csv'
+        header = 'id,username,email,role,bio,first_name,last_name\n'
+        path.write_text(
+            f'{header}1,imported,imported@yamdb.fake,admin,,,\n',
+            encoding='utf-8',
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        client = self.get_client(get_user_model().objects.get(pk=1))
+        assert client.get('/api/v1/users/').status_code == HTTPStatus.OK
+
+        path.write_text(
+            f'{header}1,imported,imported@yamdb.fake,user,,,\n',
+            encoding='utf-8',
+        )
+        call_command('import_csv', path=tmp_path, stdout=StringIO())
+        assert client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        ), (
+            'Проверьте, что смена роли при импорте лишает старые токены '
+            'прав доступа.'
+        )
+
+    def test_04_claims_need_cache_in_memory(self, admin, monkeypatch):
+        from django.conf import settings
+
+        admin_client = self.get_client(admin)
+        monkeypatch.setattr(settings, 'CACHES', {'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'cache',
+        }})
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.get('/api/v1/categories/')
+            assert response.status_code == HTTPStatus.OK
+        assert len(self.user_queries(context)) == 1, (
+            'Проверьте, что при кеше в базе данных пользователь загружается '
+            'из базы вместо проверки версии токена в кеше.'
+        )
+        with CaptureQueriesContext(connection) as context:
+            admin_client.get('/api/v1/categories/')
+        assert not self.user_queries(context)
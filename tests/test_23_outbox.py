@@ -0,0 +1,89 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23EmailOutbox:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def signup(self, client, count):
+        for idx in range(count):
+            response = client.post(self.URL_SIGNUP, data={
+                'username': f'user_{idx}',
+                'email': f'user_{idx}@yamdb.fake',
+            })
+            assert response.status_code == HTTPStatus.OK
+
+    def test_01_background_delivery(self, settings):
+        from users.models import OutboxEmail
+        from users.outbox import enqueue_email, outbox
+
+        settings.EMAIL_OUTBOX_WORKERS = 1
+        with transaction.atomic():
+            for idx in range(5):
+                enqueue_email(
+                    'Confirmation Code', 'code', None, f'user_{idx}@yamdb.fake'
+                )
+        executor, outbox.executor = outbox.executor, None
+        executor.shutdown(wait=True)
+        assert sorted(email.to[0] for email in mail.outbox) == [
+            f'user_{idx}@yamdb.fake' for idx in range(5)
+        ], 'Проверьте, что письма из очереди доставляются фоновыми потоками.'
+        assert not OutboxEmail.objects.exists()
+
+    def test_02_retry_with_backoff(self, client, monkeypatch):
+        from users import outbox
+        from users.models import OutboxEmail
+
+        def fail(*args, **kwargs):
+            raise OSError('SMTP недоступен')
+
+        monkeypatch.setattr(outbox, 'send_mass_mail', fail)
+        self.signup(client, 2)
+        assert not mail.outbox
+        emails = list(OutboxEmail.objects.all())
+        assert [email.attempts for email in emails] == [1, 1], (
+            'Проверьте, что неудачная отправка увеличивает число попыток.'
+        )
+        assert all(
+            email.next_attempt_at > timezone.now()
+            and email.claimed_until is None
+            for email in emails
+        ), 'Проверьте, что повторная отправка откладывается.'
+
+        monkeypatch.undo()
+        call_command('send_outbox', stdout=StringIO())
+        assert not mail.outbox
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        out = StringIO()
+        call_command('send_outbox', stdout=out)
+        assert '2 emails sent' in out.getvalue()
+        assert not OutboxEmail.objects.exists()
+        assert len(mail.outbox) == 2
+
+    def test_03_unexpected_error_is_retried(self, client, monkeypatch,
+                                            caplog):
+        from users import outbox
+        from users.models import OutboxEmail
+
+        def fail(*args, **kwargs):
+            raise UnicodeEncodeError('ascii', 'код', 0, 1, 'ошибка')
+
+        monkeypatch.setattr(outbox, 'send_mass_mail', fail)
+        self.signup(client, 1)
+        email = OutboxEmail.objects.get()
+        assert email.attempts == 1 and email.claimed_until is None, (
+            'Проверьте, что после любой ошибки отправки письмо '
+            'освобождается и откладывается для повтора.'
+        )
+        assert email.next_attempt_at > timezone.now()
+        assert 'Failed to deliver' in caplog.text, (
+            'Проверьте, что ошибка отправки записывается в журнал.'
+        )
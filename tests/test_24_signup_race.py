@@ -0,0 +1,80 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24SignupRace:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    @pytest.fixture(autouse=True)
+    def keep_outbox(self, monkeypatch):
+        from users.outbox import outbox
+
+        monkeypatch.setattr(outbox, 'wake', lambda: None)
+
+    @pytest.fixture(autouse=True)
+    def no_throttling(self, settings):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}
+        }
+
+    def test_01_signup_queries(self, client, django_assert_max_num_queries):
+        data = {'username': 'valid_username', 'email': 'valid@yamdb.fake'}
+        with django_assert_max_num_queries(4):
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK
+        with django_assert_max_num_queries(3):
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что повторная регистрация возвращает существующего '
+            'пользователя.'
+        )
+
+    def test_02_signup_lost_race(self, django_user_model):
+        from rest_framework.exceptions import ValidationError
+        from users.serializers import SignupSerializer
+
+        same = {'username': 'same_user', 'email': 'same@yamdb.fake'}
+        serializer = SignupSerializer(data=same)
+        assert serializer.is_valid()
+        winner = django_user_model.objects.create(**same)
+        assert serializer.save().pk == winner.pk, (
+            'Проверьте, что регистрация, проигравшая гонку одинаковому '
+            'запросу, возвращает созданного пользователя.'
+        )
+
+        serializer = SignupSerializer(
+            data={'username': 'other_user', 'email': 'shared@yamdb.fake'}
+        )
+        assert serializer.is_valid()
+        django_user_model.objects.create(
+            username='first_user', email='shared@yamdb.fake'
+        )
+        with pytest.raises(ValidationError):
+            serializer.save()
+        assert django_user_model.objects.filter(
+            email='shared@yamdb.fake'
+        ).count() == 1, (
+            'Проверьте, что email нельзя занять одновременными запросами.'
+        )
+
+    def test_03_update_taken_email(self, admin, admin_client, user,
+                                   user_client):
+        for client, url in (
+            (user_client, '/api/v1/users/me/'),
+            (admin_client, f'/api/v1/users/{user.username}/'),
+        ):
+            response = client.patch(url, data={'email': admin.email})
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что PATCH-запрос к `{url}` с email другого '
+                'пользователя возвращает ответ со статусом 400.'
+            )
+            assert 'email' in response.json()
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'email': user.email}
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что пользователь может сохранить свой же email.'
+        )
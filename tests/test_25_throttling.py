@@ -0,0 +1,94 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Throttling:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {'signup': '2/m', 'reviews': '1/m'},
+        }
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from api_yamdb.throttling import SlidingWindowThrottle
+
+        now = [1000.0]
+        monkeypatch.setattr(
+            SlidingWindowThrottle, 'timer', lambda self: now[0]
+        )
+        return now
+
+    def test_01_signup_throttled(self, clock):
+        client = APIClient()
+        for _ in range(2):
+            response = client.post(self.URL_SIGNUP, data={})
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(self.URL_SIGNUP, data={})
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что при превышении лимита запросов к '
+            f'`{self.URL_SIGNUP}` возвращается ответ со статусом 429.'
+        )
+        assert not context.captured_queries, (
+            'Проверьте, что отклонённый запрос не обращается к базе данных.'
+        )
+        retry_after = int(response['Retry-After'])
+        assert 0 < retry_after <= 120, (
+            'Проверьте, что ответ со статусом 429 содержит заголовок '
+            '`Retry-After` со временем до освобождения лимита.'
+        )
+
+        clock[0] += retry_after - 5
+        response = client.post(self.URL_SIGNUP, data={})
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        clock[0] += 5
+        response = client.post(self.URL_SIGNUP, data={})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что лимит запросов восстанавливается к моменту из '
+            '`Retry-After`.'
+        )
+        response = client.post(self.URL_SIGNUP, data={})
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    def test_02_review_create_throttled_per_user(self, clock, admin_client,
+                                                 user_client,
+                                                 moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Отзыв', 5
+        ).json()
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[1]['id']),
+            data={'text': 'Отзыв', 'score': 5},
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что создание отзывов ограничено по числу запросов.'
+        )
+        assert user_client.get(url).status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит не распространяется на чтение отзывов.'
+        )
+        create_single_review(moderator_client, titles[0]['id'], 'Отзыв', 7)
+        response = user_client.patch(
+            f'{url}{review["id"]}/', data={'text': 'Новый текст'}
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит не распространяется на изменение отзывов.'
+        )
+        response = user_client.delete(f'{url}{review["id"]}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT, (
+            'Проверьте, что лимит не распространяется на удаление отзывов.'
+        )
@@ -0,0 +1,44 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26ReviewCreate:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_review_create_queries(self, admin_client, user_client):
+        from reviews.models import Review, Title
+
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        data = {'text': 'Отзыв', 'score': 5}
+        with CaptureQueriesContext(connection) as context:
+            response = user_client.post(url, data=data)
+        assert response.status_code == HTTPStatus.CREATED
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and 'FROM "reviews_' in query['sql']
+        ]
+        assert len(selects) == 1, (
+            'Проверьте, что при создании отзыва произведение загружается '
+            'один раз, а наличие отзыва автора не проверяется отдельным '
+            'запросом.'
+        )
+
+        response = user_client.post(url, data=data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что повторный отзыв автора на произведение '
+            'возвращает ответ со статусом 400.'
+        )
+        assert Review.objects.filter(title_id=titles[0]['id']).count() == 1
+        assert Title.objects.get(pk=titles[0]['id']).score_count == 1, (
+            'Проверьте, что отклонённый повторный отзыв не меняет рейтинг '
+            'произведения.'
+        )
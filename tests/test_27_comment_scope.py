@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments, create_single_comment
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27CommentScope:
+
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_comments_scoped_to_review(self, admin_client, admin,
+                                          user_client, user,
+                                          moderator_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        create_single_comment(
+            moderator_client, titles[0]['id'], reviews[1]['id'], 'Другой'
+        )
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=reviews[1]['id']
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data['count'] == 1, (
+            f'Проверьте, что `{self.COMMENTS_URL_TEMPLATE}` возвращает '
+            'только комментарии к указанному отзыву.'
+        )
+        assert [item['text'] for item in data['results']] == ['Другой']
+
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if 'FROM "reviews_comment"' in query['sql']
+            and 'ORDER BY' in query['sql']
+        ]
+        assert selects
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {selects[0]}')
+            plan = ' '.join(str(row) for row in cursor.fetchall())
+        assert 'comment_review_pub_date_idx' in plan, (
+            'Проверьте, что выборка комментариев отзыва использует индекс '
+            'по отзыву и дате публикации.'
+        )
+
+        response = admin_client.get(f'{url}{comments[0]["id"]}/')
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что комментарий другого отзыва недоступен по адресу '
+            'этого отзыва.'
+        )
+        response = admin_client.get(self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[1]['id'], review_id=reviews[0]['id']
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что для отзыва другого произведения возвращается '
+            'ответ со статусом 404.'
+        )